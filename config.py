@@ -1,3 +1,4 @@
+import json
 import os
 from dotenv import load_dotenv
 
@@ -13,6 +14,11 @@ class Config:
     SQLALCHEMY_ENGINE_OPTIONS = {
         'pool_pre_ping': True,  # Verify connections before use
         'pool_recycle': 300,    # Recycle connections every 5 minutes
+        # Compact JSON for JSON columns (conversation contexts can run to
+        # many KB per A/B test): no separator padding, and ensure_ascii off
+        # so non-ASCII text isn't escape-inflated on the wire
+        'json_serializer': lambda obj: json.dumps(obj, separators=(',', ':'), ensure_ascii=False),
+        'json_deserializer': json.loads,
         'connect_args': {
             'connect_timeout': 10,  # 10 second connection timeout
             'read_timeout': 30,     # 30 second read timeout
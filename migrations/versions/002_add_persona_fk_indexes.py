@@ -0,0 +1,45 @@
+"""Add indexes on user_preferences persona reference columns
+
+The admin persona-delete usage check (and any lookup by persona id)
+filters user_preferences on these three columns; without indexes each
+check is a full-table scan.
+
+Revision ID: 002_add_persona_fk_indexes
+Revises: 001_update_user_preferences
+Create Date: 2026-08-31 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '002_add_persona_fk_indexes'
+down_revision = '001_update_user_preferences'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_user_preferences_active_persona_id', 'active_persona_id'),
+    ('ix_user_preferences_ab_testing_persona_a_id', 'ab_testing_persona_a_id'),
+    ('ix_user_preferences_ab_testing_persona_b_id', 'ab_testing_persona_b_id'),
+]
+
+
+def upgrade():
+    # Skip indexes that already exist (e.g. created by db.create_all in dev)
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    existing = {index['name'] for index in inspector.get_indexes('user_preferences')}
+
+    for index_name, column in INDEXES:
+        if index_name not in existing:
+            op.create_index(index_name, 'user_preferences', [column])
+
+
+def downgrade():
+    for index_name, _column in INDEXES:
+        try:
+            op.drop_index(index_name, table_name='user_preferences')
+        except Exception as e:
+            print(f"Could not drop index {index_name}: {e}")
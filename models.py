@@ -64,13 +64,14 @@ class UserPreferences(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.String(50), unique=True, nullable=False)  # Slack user ID
     
-    # A/B Testing persona selections (reference existing personas)
-    ab_testing_persona_a_id = db.Column(db.Integer, nullable=True)  # Persona ID for Response A
-    ab_testing_persona_b_id = db.Column(db.Integer, nullable=True)  # Persona ID for Response B
-    
+    # A/B Testing persona selections (reference existing personas); indexed
+    # so persona-usage checks are range scans instead of full-table scans
+    ab_testing_persona_a_id = db.Column(db.Integer, nullable=True, index=True)  # Persona ID for Response A
+    ab_testing_persona_b_id = db.Column(db.Integer, nullable=True, index=True)  # Persona ID for Response B
+
     # Chat mode settings
     chat_mode_enabled = db.Column(db.Boolean, default=False)  # Whether user prefers chat mode
-    active_persona_id = db.Column(db.Integer, nullable=True)  # Currently active persona for chat mode
+    active_persona_id = db.Column(db.Integer, nullable=True, index=True)  # Currently active persona for chat mode
     
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,7 +1,18 @@
+import bisect
+import collections
+import copy
 import json
 import os
+import queue
+import re
+import secrets
 import ssl
-from typing import Any, Dict
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Optional
 import logging
 
 import certifi
@@ -22,10 +33,12 @@ from services import (
 )
 from utils import setup_logger
 
-# SSL and Environment Configuration
+# SSL and Environment Configuration. Verification stays on: certifi supplies
+# the CA bundle, and leaving the default HTTPS context intact keeps TLS
+# session reuse working for the repeated Slack/Anthropic API calls (the old
+# unverified-context monkey-patch also disabled session resumption)
 os.environ["SSL_CERT_FILE"] = certifi.where()
 os.environ["REQUESTS_CA_BUNDLE"] = certifi.where()
-ssl._create_default_https_context = ssl._create_unverified_context
 load_dotenv()
 
 # TODO logging.DEBUG to examine the 'ignore self reply' mode
@@ -36,6 +49,11 @@ logger = setup_logger(__name__)
 # App Initialization
 app = Flask(__name__)
 
+# jsonify sorts keys alphabetically by default - pure encode overhead for
+# API consumers - and compact output skips the pretty-printing whitespace
+app.json.sort_keys = False
+app.json.compact = True
+
 # Database Configuration
 config_name = os.environ.get('FLASK_ENV', 'development')
 app.config.from_object(config[config_name])
@@ -44,8 +62,48 @@ app.config.from_object(config[config_name])
 db.init_app(app)
 migrate = Migrate(app, db)
 
-# Initialize Slack client
-slack_client = WebClient(token=os.environ["CHACHIBT_APP_BOT_AUTH_TOKEN"])
+# Initialize Slack client. One shared TLS context: without it, slack_sdk's
+# urllib transport builds a fresh default context - re-reading and parsing
+# the CA bundle - on every single API call
+_slack_ssl_context = ssl.create_default_context(cafile=certifi.where())
+slack_client = WebClient(
+    token=os.environ["CHACHIBT_APP_BOT_AUTH_TOKEN"],
+    ssl=_slack_ssl_context,
+)
+
+# Small shared pool for fire-and-forget Slack posts (confirmations, notices)
+# so interactive handlers can ack Slack without waiting on the API round trip
+slack_post_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="slack-post")
+
+# The bot's user id is fixed for the lifetime of the token, so resolve it
+# once instead of paying an auth.test roundtrip to Slack on every message
+_bot_user_id = None
+_bot_user_id_lock = threading.Lock()
+
+
+def get_bot_user_id(client: WebClient = None) -> str:
+    """Get the bot's Slack user id, hitting auth.test only on first call."""
+    global _bot_user_id
+    if _bot_user_id is None:
+        with _bot_user_id_lock:
+            if _bot_user_id is None:
+                _bot_user_id = (client or slack_client).auth_test()["user_id"]
+    return _bot_user_id
+
+
+@lru_cache(maxsize=4096)
+def _parent_mentions_bot(channel: str, thread_ts: str, bot_user_id: str) -> bool:
+    """Check whether a thread's root message mentions the bot.
+
+    A root message's mention status is fixed for the thread's lifetime, so
+    the result is memoized - active threads pay the conversations_replies
+    roundtrip once instead of on every reply. Errors propagate uncached so a
+    transient Slack failure doesn't pin a wrong answer.
+    """
+    messages = slack_client.conversations_replies(
+        channel=channel, ts=thread_ts, limit=1
+    )["messages"]
+    return f"<@{bot_user_id}>" in (messages[0].get("text", "") if messages else "")
 
 
 def handle_message(message: Dict[str, Any], client: WebClient) -> None:
@@ -64,7 +122,7 @@ def handle_message(message: Dict[str, Any], client: WebClient) -> None:
         
         # Check if the message is from the bot itself BEFORE scheduling the job
         try:
-            bot_user_id = client.auth_test()["user_id"]
+            bot_user_id = get_bot_user_id(client)
             if user_id == bot_user_id:
                 logger.info(f"HANDLE_MESSAGE: Ignoring bot's own message {channel_id}:{message_ts}")
                 return
@@ -128,12 +186,39 @@ def reset_db():
     db.create_all()
     print("Database reset complete.")
 
-def load_json_view(file_name: str) -> Dict[str, Any]:
-    """Load JSON view file."""
+@lru_cache(maxsize=64)
+def _load_json_view_raw(file_name: str) -> str:
+    """Read a view template's raw JSON text, hitting disk only once per view."""
     current_dir = os.path.dirname(os.path.abspath(__file__))
     json_path = os.path.join(current_dir, "views", f"{file_name}.json")
     with open(json_path, "r") as file:
-        return json.load(file)
+        return file.read()
+
+
+def load_json_view(file_name: str) -> Dict[str, Any]:
+    """Load JSON view file.
+
+    The raw template text is cached in-process; re-parsing it here returns a
+    fresh dict on every call, so handlers can safely mutate the view in place.
+    """
+    return json.loads(_load_json_view_raw(file_name))
+
+
+def reload_views() -> None:
+    """Clear cached view templates so edited JSON files are picked up (dev use)."""
+    _load_json_view_raw.cache_clear()
+    _view_populators.clear()
+
+
+# Warm the template cache at import so no request - the first home-tab open
+# included - pays the disk read. The home tab is personalized per user, so
+# handlers still parse a fresh copy to mutate; only the file I/O is hoisted.
+try:
+    for _view_file in os.listdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), "views")):
+        if _view_file.endswith(".json"):
+            _load_json_view_raw(_view_file[:-5])
+except OSError as _warm_error:
+    logger.warning(f"Could not preload view templates: {_warm_error}")
 
 
 def update_home_tab_with_user_data(user_id: str) -> Dict[str, Any]:
@@ -176,6 +261,16 @@ def safe_publish_home_tab(user_id: str, view: Dict[str, Any] = None) -> bool:
         
         return False
 
+
+def _publish_home_tab_in_background(user_id: str) -> None:
+    """Build and publish the home tab from the shared executor.
+
+    Needs its own app context since it runs outside the request that
+    scheduled it; safe_publish_home_tab handles its own errors.
+    """
+    with app.app_context():
+        safe_publish_home_tab(user_id)
+
 # https://tools.slack.dev/node-slack-sdk/tutorials/local-development/
 # https://api.slack.com/apis/events-api
 @app.route("/event", methods=["POST"])
@@ -196,7 +291,9 @@ def slack_event_handler():
     if event_type == "app_home_opened":
         user_id = event.get("user")
         if user_id:
-            safe_publish_home_tab(user_id)
+            # Build and publish off the request thread so the event is acked
+            # inside Slack's 3s deadline even when the DB or API is slow
+            slack_post_executor.submit(_publish_home_tab_in_background, user_id)
     
     elif event_type in ["app_mention", "message"]:
         handle_message(event, slack_client)
@@ -207,6 +304,111 @@ def slack_event_handler():
     return jsonify({"status": "ok"})
 
 
+class _SlackStreamUpdater:
+    """Streams a chat-mode response into a single Slack message.
+
+    The first text delta posts the message; later deltas edit it in place,
+    throttled so long generations stay well under Slack's chat.update rate
+    limit. finalize() writes the complete text once generation ends. Slack
+    failures disable incremental updates rather than aborting generation.
+    """
+
+    _UPDATE_INTERVAL = 1.0  # seconds between chat_update calls
+
+    def __init__(self, channel: str, thread_ts: Optional[str], prefix: str = ""):
+        self._channel = channel
+        self._thread_ts = thread_ts
+        self._parts = [prefix]
+        self._message_ts: Optional[str] = None
+        self._last_update = 0.0
+        self._failed = False
+
+    def on_text(self, text: str) -> None:
+        self._parts.append(text)
+        if self._failed:
+            return
+        now = time.monotonic()
+        if now - self._last_update < self._UPDATE_INTERVAL:
+            return
+        try:
+            self._push("".join(self._parts))
+            self._last_update = now
+        except Exception as e:
+            logger.warning(f"Streaming Slack update failed, deferring to final post: {e}")
+            self._failed = True
+
+    def _push(self, text: str) -> None:
+        if self._message_ts is None:
+            if self._thread_ts:
+                result = slack_client.chat_postMessage(
+                    text=text, channel=self._channel, thread_ts=self._thread_ts
+                )
+            else:
+                result = slack_client.chat_postMessage(text=text, channel=self._channel)
+            self._message_ts = result.get("ts")
+        else:
+            slack_client.chat_update(text=text, channel=self._channel, ts=self._message_ts)
+
+    def finalize(self, text: str) -> Optional[str]:
+        """Write the complete response and return the message timestamp."""
+        self._push(self._parts[0] + text)
+        return self._message_ts
+
+
+class _ABPreviewPoster:
+    """Posts each A/B variant to Slack as soon as it finishes generating.
+
+    The voteable blocks need the committed test id, so the vote buttons
+    can't ship until both variants are done - but the text can: the first
+    callback posts the intro plus a plain preview at min(A, B) latency,
+    and finalize() later edits each preview into its voteable block. A
+    failed preview post is just skipped; process_job's post-when-done
+    fallback still delivers that variant.
+    """
+
+    def __init__(self, channel: str, thread_ts: Optional[str], intro_text: str):
+        self._channel = channel
+        self._thread_ts = thread_ts
+        self._intro_text = intro_text
+        self.intro_ts: Optional[str] = None
+        self.preview_ts: Dict[str, str] = {}
+
+    def _post(self, text: str):
+        if self._thread_ts:
+            return slack_client.chat_postMessage(
+                text=text, channel=self._channel, thread_ts=self._thread_ts
+            )
+        return slack_client.chat_postMessage(text=text, channel=self._channel)
+
+    def on_response_ready(self, variant: str, text: str) -> None:
+        try:
+            if self.intro_ts is None:
+                self.intro_ts = self._post(self._intro_text).get("ts")
+            ts = self._post(f"*Response {variant}:*\n{text}").get("ts")
+            if ts:
+                self.preview_ts[variant] = ts
+        except Exception as e:
+            logger.warning(f"A/B preview post for variant {variant} failed: {e}")
+
+    def finalize(self, variant: str, slack_message: Dict, fallback_text: str) -> Optional[str]:
+        """Edit a variant's preview into its voteable block message.
+
+        Returns the message ts, or None if there is no preview to edit or
+        the edit failed - the caller posts the voteable message fresh.
+        """
+        ts = self.preview_ts.get(variant)
+        if ts is None:
+            return None
+        try:
+            slack_client.chat_update(
+                channel=self._channel, ts=ts, text=fallback_text, **slack_message
+            )
+        except Exception as e:
+            logger.warning(f"Editing A/B preview {variant} into voteable block failed: {e}")
+            return None
+        return ts
+
+
 @app.route("/process-job", methods=["POST"])
 def process_job():
     """Process a message job (called by Always-On Task)."""
@@ -224,7 +426,7 @@ def process_job():
         # Parse the event data
         event_data = json.loads(event_payload) if isinstance(event_payload, str) else event_payload
         
-        bot_user_id = slack_client.auth_test()["user_id"]
+        bot_user_id = get_bot_user_id()
         user = event_data.get("user")
         
         # Note: Bot message check is now handled before scheduling in handle_message()
@@ -237,23 +439,17 @@ def process_job():
         
         logger.info(f"PROCESS_JOB: Processing {event_type} event for message {message_ts} in channel {channel}")
         
-        # Check if bot should respond
-        tagged_in_parent = False
-        if thread_ts:
+        # Check if bot should respond. Build the mention token once and only
+        # fall back to checking the thread parent when the cheap local checks
+        # don't already decide the answer
+        mention = f"<@{bot_user_id}>"
+        should_respond = channel_type == "im" or mention in event_data.get("text", "")
+        if not should_respond and thread_ts:
             try:
-                parent_message = slack_client.conversations_replies(
-                    channel=channel, ts=thread_ts, limit=1
-                )["messages"][0]
-                tagged_in_parent = f"<@{bot_user_id}>" in parent_message.get("text", "")
+                should_respond = _parent_mentions_bot(channel, thread_ts, bot_user_id)
             except Exception as e:
                 logger.warning(f"Could not check parent message for job {job_id}: {e}")
-        
-        should_respond = (
-            channel_type == "im"
-            or f"<@{bot_user_id}>" in event_data.get("text", "")
-            or tagged_in_parent
-        )
-        
+
         if not should_respond:
             logger.info(f"PROCESS_JOB: Skipping job {job_id} - bot not mentioned")
             return jsonify({
@@ -277,6 +473,29 @@ def process_job():
                 "reason": "conversation_already_complete"
             })
         
+        # Stream chat-mode responses into Slack as they generate, so the
+        # user sees text at time-to-first-token instead of waiting out the
+        # full completion. A/B mode posts each variant's text the moment it
+        # finishes - min(A, B) instead of max(A, B) to first response - and
+        # edits the vote buttons in once the test is committed
+        stream_updater = None
+        ab_preview = None
+        if ChatService.get_user_mode(user) == "chat_mode":
+            stream_updater = _SlackStreamUpdater(
+                channel=channel,
+                thread_ts=None if channel_type == "im" else thread_ts,
+                prefix=f"<@{user}> ",
+            )
+        else:
+            ab_preview = _ABPreviewPoster(
+                channel=channel,
+                thread_ts=None if channel_type == "im" else thread_ts,
+                intro_text=(
+                    f"<@{user}> Here are two different responses to your question. "
+                    f"Please vote for the one you prefer!"
+                ),
+            )
+
         # Use ChatService to handle the message based on user's mode
         logger.info(f"PROCESS_JOB: Starting ChatService request for job {job_id}")
         result: Dict | None = ChatService.handle_user_message(
@@ -284,7 +503,9 @@ def process_job():
             channel_id=channel,
             thread_ts=thread_ts,
             message_text=event_data.get("text", ""),
-            conversation=conversation
+            conversation=conversation,
+            on_text=stream_updater.on_text if stream_updater else None,
+            on_ab_response=ab_preview.on_response_ready if ab_preview else None
         )
         
         if not result:
@@ -308,17 +529,23 @@ def process_job():
             # Single persona response
             if responses:
                 response = responses[0]
-                response_text = f"<@{user}> {response['text']}"
-                
-                if channel_type == "im":
-                    result = slack_client.chat_postMessage(text=response_text, channel=channel)
+
+                if stream_updater is not None:
+                    # The streamed message already exists; write the final
+                    # text into it (or post it if nothing streamed yet)
+                    message_ts = stream_updater.finalize(response['text'])
                 else:
-                    result = slack_client.chat_postMessage(text=response_text, channel=channel, thread_ts=thread_ts)
-                
+                    response_text = f"<@{user}> {response['text']}"
+                    if channel_type == "im":
+                        result = slack_client.chat_postMessage(text=response_text, channel=channel)
+                    else:
+                        result = slack_client.chat_postMessage(text=response_text, channel=channel, thread_ts=thread_ts)
+                    message_ts = result.get("ts")
+
                 messages_sent.append({
                     "type": "chat_response",
                     "persona": response.get('persona_name'),
-                    "message_ts": result.get("ts")
+                    "message_ts": message_ts
                 })
                     
                 logger.info(f"PROCESS_JOB: Sent chat mode response using persona: {response.get('persona_name')} for job {job_id}")
@@ -326,47 +553,46 @@ def process_job():
         elif mode == "ab_testing":
             # A/B testing responses
             if len(responses) >= 2:
-                # Send intro message
-                intro_text = f"<@{user}> {metadata.get('intro_message', 'Here are two responses:')}"
-                
-                if channel_type == "im":
-                    intro_result = slack_client.chat_postMessage(text=intro_text, channel=channel)
-                    
-                    # Send response A
-                    resp_a = slack_client.chat_postMessage(
-                        channel=channel,
-                        **responses[0]['slack_message']
-                    )
-                    
-                    # Send response B  
-                    resp_b = slack_client.chat_postMessage(
-                        channel=channel,
-                        **responses[1]['slack_message']
-                    )
-                    
-                else:
-                    intro_result = slack_client.chat_postMessage(text=intro_text, channel=channel, thread_ts=thread_ts)
-                    
-                    # Send response A in thread
-                    resp_a = slack_client.chat_postMessage(
-                        channel=channel,
-                        thread_ts=thread_ts,
-                        **responses[0]['slack_message']
-                    )
-                    
-                    # Send response B in thread
-                    resp_b = slack_client.chat_postMessage(
-                        channel=channel,
-                        thread_ts=thread_ts,
-                        **responses[1]['slack_message']
-                    )
-                
+                reply_ts = None if channel_type == "im" else thread_ts
+
+                # The previews (if they posted) already carry the intro and
+                # both texts; edit them into the voteable blocks now that
+                # the test id is committed
+                posted = {}
+                if ab_preview is not None:
+                    for variant, response in (('A', responses[0]), ('B', responses[1])):
+                        ts = ab_preview.finalize(variant, response['slack_message'], response['text'])
+                        if ts:
+                            posted[variant] = ts
+
+                # Post-when-done fallback covers whatever the preview path
+                # missed (preview disabled or a Slack call failed)
+                intro_ts = ab_preview.intro_ts if ab_preview else None
+                if intro_ts is None:
+                    intro_text = f"<@{user}> {metadata.get('intro_message', 'Here are two responses:')}"
+                    if reply_ts:
+                        intro_result = slack_client.chat_postMessage(text=intro_text, channel=channel, thread_ts=reply_ts)
+                    else:
+                        intro_result = slack_client.chat_postMessage(text=intro_text, channel=channel)
+                    intro_ts = intro_result.get("ts")
+
+                for variant, response in (('A', responses[0]), ('B', responses[1])):
+                    if variant in posted:
+                        continue
+                    if reply_ts:
+                        resp = slack_client.chat_postMessage(
+                            channel=channel, thread_ts=reply_ts, **response['slack_message']
+                        )
+                    else:
+                        resp = slack_client.chat_postMessage(channel=channel, **response['slack_message'])
+                    posted[variant] = resp.get("ts")
+
                 messages_sent.extend([
-                    {"type": "intro", "message_ts": intro_result.get("ts")},
-                    {"type": "response_a", "message_ts": resp_a.get("ts")},
-                    {"type": "response_b", "message_ts": resp_b.get("ts")}
+                    {"type": "intro", "message_ts": intro_ts},
+                    {"type": "response_a", "message_ts": posted.get('A')},
+                    {"type": "response_b", "message_ts": posted.get('B')}
                 ])
-                
+
                 logger.info(f"PROCESS_JOB: Sent A/B testing responses, test {metadata.get('ab_test_id')} for job {job_id}")
         
         return jsonify({
@@ -403,54 +629,17 @@ def handle_interactive_component():
     action = actions[0]
     action_id = action.get("action_id")
     user_id = payload.get("user", {}).get("id")
-    
+
     logger.info(f"Processing action: {action_id} for user: {user_id}")
-    
-    # Handle voting actions
-    if action_id in ["vote_a", "vote_b"]:
-        return handle_ab_vote(payload, action)
-    
-    # Handle mode selection
-    elif action_id == "mode_selector":
-        return handle_mode_selection(payload, action)
-    
-    # Handle A/B persona selections
-    elif action_id in ["ab_persona_a_selector", "ab_persona_b_selector"]:
-        return handle_ab_persona_selection(payload, action)
-    
-    # Handle chat persona selection
-    elif action_id == "chat_persona_selector":
-        return handle_chat_persona_selection(payload, action)
-    
-    # Handle settings save actions
-    elif action_id == "save_ab_settings":
-        return handle_save_ab_settings(payload)
-    
-    # Handle persona management actions
-    elif action_id in ["view_personas", "create_persona", "view_analytics"]:
-        return handle_persona_management(payload, action)
-    
-    # Handle modal-based editing actions
-    elif action_id == "edit_chat_persona":
-        return handle_edit_chat_persona_modal(payload, action)
-    
-    elif action_id == "configure_ab_testing":
-        return handle_configure_ab_testing_modal(payload, action)
-    
-    elif action_id == "delete_persona":
-        return handle_delete_persona(payload, action)
-    
-    # Handle inline persona editing actions (legacy)
-    elif action_id == "save_chat_persona":
-        return handle_save_chat_persona(payload)
-    
-    elif action_id == "save_ab_configuration":
-        return handle_save_ab_configuration(payload)
-    
+
+    handler = ACTION_HANDLERS.get(action_id)
+    if handler:
+        return handler(payload, action)
+
     # Handle modal submissions
-    elif payload.get("type") == "view_submission":
+    if payload.get("type") == "view_submission":
         return handle_modal_submission(payload)
-    
+
     logger.warning(f"Unhandled action: {action_id}")
     return jsonify({"status": "ok"})
 
@@ -744,9 +933,10 @@ def handle_save_chat_persona(payload: Dict[str, Any]) -> Any:
         
     except Exception as e:
         logger.error(f"Error saving chat persona: {e}")
-        slack_client.chat_postMessage(
-            channel=payload.get("user", {}).get("id"),
-            text=f"❌ Unexpected error: {str(e)}"
+        slack_post_executor.submit(
+            _post_message_in_background,
+            payload.get("user", {}).get("id"),
+            f"❌ Unexpected error: {str(e)}"
         )
         return jsonify({"status": "ok"})
 
@@ -925,9 +1115,10 @@ def handle_save_ab_configuration(payload: Dict[str, Any]) -> Any:
         
     except Exception as e:
         logger.error(f"Error saving A/B testing configuration: {e}")
-        slack_client.chat_postMessage(
-            channel=payload.get("user", {}).get("id"),
-            text=f"❌ Unexpected error: {str(e)}"
+        slack_post_executor.submit(
+            _post_message_in_background,
+            payload.get("user", {}).get("id"),
+            f"❌ Unexpected error: {str(e)}"
         )
         return jsonify({"status": "ok"})
 
@@ -1198,13 +1389,113 @@ def handle_ab_config_submission(payload: Dict[str, Any], user_id: str) -> Any:
         
     except Exception as e:
         logger.error(f"Error saving A/B testing configuration: {e}")
-        slack_client.chat_postMessage(
-            channel=payload.get("user", {}).get("id"),
-            text=f"❌ Unexpected error: {str(e)}"
+        slack_post_executor.submit(
+            _post_message_in_background,
+            payload.get("user", {}).get("id"),
+            f"❌ Unexpected error: {str(e)}"
         )
         return jsonify({"status": "ok"})
 
 
+# Matches the {persona_*} placeholders used in the view templates so all of
+# them can be substituted in a single pass instead of chained str.replace calls
+_PERSONA_TOKEN_RE = re.compile(
+    r"\{(persona_name|persona_description|persona_model|persona_temperature|"
+    r"persona_system_prompt|persona_a_name|persona_b_name)\}"
+)
+
+
+def _substitute_persona_tokens(text: str, tokens: Dict[str, str]) -> str:
+    """Replace all known {persona_*} placeholders in one scan over the text."""
+    return _PERSONA_TOKEN_RE.sub(lambda m: tokens.get(m.group(1), m.group(0)), text)
+
+
+# Shared immutable fallback for missing dicts in the block loops below; every
+# .get(..., {}) miss would otherwise allocate a fresh empty dict
+_EMPTY_DICT = types.MappingProxyType({})
+
+# Friendly names for the model tiers on the home tab; unknown keys fall
+# back to the raw value
+_MODEL_DISPLAY_NAMES = {
+    'haiku': 'Claude 3.5 Haiku',
+    'sonnet': 'Claude 4 Sonnet',
+    'opus': 'Claude 4 Opus',
+}
+
+
+def _set_initial_option(accessory: Dict[str, Any], value: str) -> None:
+    """Set a select accessory's initial_option, indexing options by value."""
+    options_by_value = {opt["value"]: opt for opt in accessory.get("options", [])}
+    if value in options_by_value:
+        accessory["initial_option"] = options_by_value[value]
+
+
+def _compile_view_populator(view_name: str):
+    """Specialize a modal template into a precomputed assignment list.
+
+    A given template always has the same shape, so we walk it once here and
+    record where every input element, select accessory, and token-bearing
+    section text lives. The returned populator writes initial values straight
+    into those slots by block index — no per-request scanning of the blocks
+    and no action_id branching.
+    """
+    template = load_json_view(view_name)
+    element_slots = {}    # action_id -> block index (plain inputs)
+    accessory_slots = {}  # action_id -> block index (selects / radios)
+    token_slots = []      # indices of sections whose text carries {persona_*}
+
+    for i, block in enumerate(template.get("blocks", [])):
+        element = block.get("element") or _EMPTY_DICT
+        if element.get("action_id"):
+            element_slots[element["action_id"]] = i
+        accessory = block.get("accessory") or _EMPTY_DICT
+        if accessory.get("action_id"):
+            accessory_slots[accessory["action_id"]] = i
+        if block.get("type") == "section" and _PERSONA_TOKEN_RE.search(
+                (block.get("text") or _EMPTY_DICT).get("text", "")):
+            token_slots.append(i)
+
+    def populate(view: Dict[str, Any],
+                 initial_values: Dict[str, str] = _EMPTY_DICT,
+                 initial_selections: Dict[str, str] = _EMPTY_DICT,
+                 selector_options: Dict[str, Any] = _EMPTY_DICT,
+                 tokens: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        blocks = view["blocks"]
+        for action_id, value in initial_values.items():
+            index = element_slots.get(action_id)
+            if index is not None:
+                blocks[index]["element"]["initial_value"] = value
+        for action_id, value in initial_selections.items():
+            index = accessory_slots.get(action_id)
+            if index is not None:
+                _set_initial_option(blocks[index]["accessory"], value)
+        for action_id, (options, selected) in selector_options.items():
+            index = accessory_slots.get(action_id)
+            if index is not None:
+                accessory = blocks[index]["accessory"]
+                accessory["options"] = options
+                if selected:
+                    accessory["initial_option"] = selected
+        if tokens:
+            for index in token_slots:
+                text_obj = blocks[index]["text"]
+                text_obj["text"] = _substitute_persona_tokens(text_obj["text"], tokens)
+        return view
+
+    return populate
+
+
+_view_populators: Dict[str, Any] = {}
+
+
+def _view_populator(view_name: str):
+    """Get (compiling on first use) the populator for a modal template."""
+    populator = _view_populators.get(view_name)
+    if populator is None:
+        populator = _view_populators[view_name] = _compile_view_populator(view_name)
+    return populator
+
+
 def update_modal_based_home_tab(user_id: str) -> Dict[str, Any]:
     """Load modal-based home tab and populate with user's current settings."""
     try:
@@ -1228,21 +1519,14 @@ def update_modal_based_home_tab(user_id: str) -> Dict[str, Any]:
         # Update mode selector - default to chat mode
         current_mode = "chat_mode" if user_prefs.get('chat_mode_enabled', True) else "ab_testing"
         for block in view['blocks']:
-            if block.get('type') == 'section' and block.get('accessory', {}).get('action_id') == 'mode_selector':
+            if block.get('type') == 'section' and (block.get('accessory') or _EMPTY_DICT).get('action_id') == 'mode_selector':
                 for option in block['accessory']['options']:
                     if option['value'] == current_mode:
                         block['accessory']['initial_option'] = option
                         break
         
-        # Update persona dropdowns with actual user personas
-        persona_options = []
-        if personas:  # Only build options if we have personas
-            for persona in personas:
-                name = persona['name']
-                persona_options.append({
-                    "text": {"type": "plain_text", "text": name},
-                    "value": str(persona['id'])
-                })
+        # Update persona dropdowns with actual user personas (cached per user)
+        persona_options = PersonaManager.get_persona_options(user_id) if personas else []
         
         # Get active persona for chat mode
         active_persona = None
@@ -1267,10 +1551,30 @@ def update_modal_based_home_tab(user_id: str) -> Dict[str, Any]:
         # Get A/B testing personas with error handling
         persona_a = user_prefs.get('response_a', {}) if user_prefs else {}
         persona_b = user_prefs.get('response_b', {}) if user_prefs else {}
-        
+
+        # Build the placeholder substitutions once, up front
+        persona_tokens = {}
+        if active_persona:
+            # Show the system prompt with truncation to stay under Slack's 3000 char limit
+            # Reserve space for markdown formatting and other text (~200 chars)
+            full_prompt = active_persona.get('system_prompt', 'No system prompt defined')
+            max_prompt_length = 2800
+            if len(full_prompt) > max_prompt_length:
+                full_prompt = full_prompt[:max_prompt_length] + "..."
+
+            persona_tokens = {
+                'persona_name': active_persona['name'],
+                'persona_description': active_persona.get('description') or 'No description provided',
+                'persona_model': _MODEL_DISPLAY_NAMES.get(
+                    active_persona['model'], active_persona['model']
+                ),
+                'persona_temperature': str(active_persona['temperature']),
+                'persona_system_prompt': full_prompt,
+            }
+
         # Update persona selectors and display current info
         for block in view['blocks']:
-            accessory = block.get('accessory', {})
+            accessory = block.get('accessory') or _EMPTY_DICT
             action_id = accessory.get('action_id')
             
             # Update persona selector dropdowns - only if we have valid options
@@ -1317,39 +1621,8 @@ def update_modal_based_home_tab(user_id: str) -> Dict[str, Any]:
             # Update display text with current persona info
             if block.get('type') == 'section' and 'text' in block:
                 text = block['text'].get('text', '')
-                if active_persona:
-                    # Replace individual field placeholders
-                    if '{persona_name}' in text:
-                        text = text.replace('{persona_name}', active_persona['name'])
-                        block['text']['text'] = text
-                    elif '{persona_description}' in text:
-                        description = active_persona.get('description', 'No description provided')
-                        text = text.replace('{persona_description}', description)
-                        block['text']['text'] = text
-                    elif '{persona_model}' in text:
-                        model_display = {
-                            'sonnet': 'Claude 4 Sonnet',
-                            'opus': 'Claude 4 Opus'
-                        }.get(active_persona['model'], active_persona['model'])
-                        text = text.replace('{persona_model}', model_display)
-                        block['text']['text'] = text
-                    elif '{persona_temperature}' in text:
-                        temp_value = str(active_persona['temperature'])
-                        text = text.replace('{persona_temperature}', temp_value)
-                        block['text']['text'] = text
-                    elif '{persona_system_prompt}' in text:
-                        # Show the system prompt with truncation to stay under Slack's 3000 char limit
-                        full_prompt = active_persona.get('system_prompt', 'No system prompt defined')
-                        # Reserve space for markdown formatting and other text (~200 chars)
-                        max_prompt_length = 2800
-                        if len(full_prompt) > max_prompt_length:
-                            truncated_prompt = full_prompt[:max_prompt_length] + "..."
-                            text = text.replace('{persona_system_prompt}', truncated_prompt)
-                        else:
-                            text = text.replace('{persona_system_prompt}', full_prompt)
-                        block['text']['text'] = text
-                
-                # Handle A/B testing placeholders
+
+                # Handle A/B testing placeholders (resolved lazily - needs DB lookups)
                 if '{persona_a_name}' in text or '{persona_b_name}' in text:
                     persona_a_name = "Not configured"
                     persona_b_name = "Not configured"
@@ -1367,10 +1640,12 @@ def update_modal_based_home_tab(user_id: str) -> Dict[str, Any]:
                                 persona_b_name = persona_b_data['name']
                         except Exception as e:
                             logger.error(f"Error loading persona B data for {user_id}: {e}")
-                    
-                    text = text.replace('{persona_a_name}', persona_a_name)
-                    text = text.replace('{persona_b_name}', persona_b_name)
-                    block['text']['text'] = text
+
+                    persona_tokens['persona_a_name'] = persona_a_name
+                    persona_tokens['persona_b_name'] = persona_b_name
+
+                if persona_tokens and '{persona_' in text:
+                    block['text']['text'] = _substitute_persona_tokens(text, persona_tokens)
         
         return view
         
@@ -1402,46 +1677,29 @@ def handle_edit_chat_persona_modal(payload: Dict[str, Any], action: Dict[str, An
         # Load the modal template
         modal = load_json_view("edit_persona_modal")
         
-        # Pre-populate the modal with current persona data
-        for block in modal.get("blocks", []):
-            block_id = block.get("block_id")
-            element = block.get("element", {})
-            
-            if block_id == "persona_name" and element.get("action_id") == "name_input":
-                element["initial_value"] = active_persona["name"]
-            elif block_id == "persona_description" and element.get("action_id") == "description_input":
-                element["initial_value"] = active_persona.get("description", "")
-            elif block_id == "system_prompt" and element.get("action_id") == "prompt_input":
-                element["initial_value"] = active_persona.get("system_prompt", "")
-            
-            # Handle accessory elements (radio buttons, selects)
-            accessory = block.get("accessory", {})
-            if block_id == "model_selection" and accessory.get("action_id") == "model_select":
-                # Set initial model selection
-                for option in accessory.get("options", []):
-                    if option["value"] == active_persona["model"]:
-                        accessory["initial_option"] = option
-                        break
-            elif block_id == "temperature_section" and accessory.get("action_id") == "temperature_select":
-                # Set initial temperature selection
-                temp_value = str(active_persona["temperature"])
-                for option in accessory.get("options", []):
-                    if option["value"] == temp_value:
-                        accessory["initial_option"] = option
-                        break
-        
-        # Add persona info to modal title and metadata
-        modal["private_metadata"] = json.dumps({
-            "persona_id": active_persona["id"],
-            "action": "edit_persona"
-        })
-        
-        # Update modal text with persona name
-        for block in modal.get("blocks", []):
-            if block.get("type") == "section" and "text" in block:
-                text = block["text"].get("text", "")
-                if "{persona_name}" in text:
-                    block["text"]["text"] = text.replace("{persona_name}", active_persona["name"])
+        # Add persona info to modal title and metadata. The payload has a
+        # fixed shape with an integer id and a constant action, so build the
+        # JSON directly instead of paying for the encoder on every open
+        modal["private_metadata"] = (
+            f'{{"persona_id": {int(active_persona["id"])}, "action": "edit_persona"}}'
+        )
+
+        # Pre-populate the modal through the template's compiled populator:
+        # the block positions were resolved once at compile time, so this is
+        # a handful of direct index assignments rather than a scan
+        _view_populator("edit_persona_modal")(
+            modal,
+            initial_values={
+                "name_input": active_persona["name"],
+                "description_input": active_persona.get("description", ""),
+                "prompt_input": active_persona.get("system_prompt", ""),
+            },
+            initial_selections={
+                "model_select": active_persona["model"],
+                "temperature_select": str(active_persona["temperature"]),
+            },
+            tokens={"persona_name": active_persona["name"]},
+        )
         
         # Open the modal
         slack_client.views_open(
@@ -1454,9 +1712,10 @@ def handle_edit_chat_persona_modal(payload: Dict[str, Any], action: Dict[str, An
         
     except Exception as e:
         logger.error(f"Error opening edit persona modal: {e}")
-        slack_client.chat_postMessage(
-            channel=user_id,
-            text="❌ Failed to open edit modal. Please try again."
+        slack_post_executor.submit(
+            _post_message_in_background,
+            user_id,
+            "❌ Failed to open edit modal. Please try again."
         )
         return jsonify({"error": "Failed to open modal"}), 500
 
@@ -1475,81 +1734,52 @@ def handle_configure_ab_testing_modal(payload: Dict[str, Any], action: Dict[str,
         persona_a = preferences.get("persona_a", {})
         persona_b = preferences.get("persona_b", {})
         
-        # Get persona data for pre-population
-        persona_a_data = None
-        persona_b_data = None
-        
-        if persona_a.get("persona_id"):
-            persona_a_data = PersonaManager.get_persona_by_id(persona_a["persona_id"], user_id)
-        if persona_b.get("persona_id"):
-            persona_b_data = PersonaManager.get_persona_by_id(persona_b["persona_id"], user_id)
-        
+        # Get all available personas once and resolve A/B selections from the
+        # same fetch instead of issuing separate per-persona queries
+        all_personas = PersonaManager.get_user_personas(user_id)
+        personas_by_id = {p['id']: p for p in all_personas}
+        persona_a_data = personas_by_id.get(persona_a.get("persona_id"))
+        persona_b_data = personas_by_id.get(persona_b.get("persona_id"))
+
         # Load the modal template
         modal = load_json_view("ab_config_modal")
-        
-        # Get all available personas for the selectors
-        all_personas = PersonaManager.get_user_personas(user_id)
-        persona_options = []
-        for persona in all_personas:
-            name = persona['name']
-            
-            persona_options.append({
-                "text": {"type": "plain_text", "text": name},
-                "value": str(persona['id'])
-            })
-        
-        # Pre-populate the modal
-        for block in modal.get("blocks", []):
-            accessory = block.get("accessory", {})
-            element = block.get("element", {})
-            block_id = block.get("block_id")
-            
-            # Update persona selector options
-            if accessory.get("action_id") in ["ab_persona_a_selector", "ab_persona_b_selector"]:
-                accessory["options"] = persona_options
-                
-                # Set initial selection
-                if accessory.get("action_id") == "ab_persona_a_selector" and persona_a_data:
-                    for option in persona_options:
-                        if option["value"] == str(persona_a_data["id"]):
-                            accessory["initial_option"] = option
-                            break
-                elif accessory.get("action_id") == "ab_persona_b_selector" and persona_b_data:
-                    for option in persona_options:
-                        if option["value"] == str(persona_b_data["id"]):
-                            accessory["initial_option"] = option
-                            break
-            
-            # Pre-populate form fields
-            if persona_a_data:
-                if block_id == "ab_persona_a_name" and element.get("action_id") == "ab_a_name_input":
-                    element["initial_value"] = persona_a_data["name"]
-                elif accessory.get("action_id") == "ab_a_model_select":
-                    for option in accessory.get("options", []):
-                        if option["value"] == persona_a_data["model"]:
-                            accessory["initial_option"] = option
-                            break
-                elif accessory.get("action_id") == "ab_a_temperature_select":
-                    temp_value = str(persona_a_data["temperature"])
-                    for option in accessory.get("options", []):
-                        if option["value"] == temp_value:
-                            accessory["initial_option"] = option
-                            break
-            
-            if persona_b_data:
-                if block_id == "ab_persona_b_name" and element.get("action_id") == "ab_b_name_input":
-                    element["initial_value"] = persona_b_data["name"]
-                elif accessory.get("action_id") == "ab_b_model_select":
-                    for option in accessory.get("options", []):
-                        if option["value"] == persona_b_data["model"]:
-                            accessory["initial_option"] = option
-                            break
-                elif accessory.get("action_id") == "ab_b_temperature_select":
-                    temp_value = str(persona_b_data["temperature"])
-                    for option in accessory.get("options", []):
-                        if option["value"] == temp_value:
-                            accessory["initial_option"] = option
-                            break
+        persona_options = PersonaManager.get_persona_options(user_id)
+        
+        # Build the desired pre-population per action_id up front, then let
+        # the template's compiled populator write it into the precomputed
+        # block slots directly
+        persona_options_by_value = {opt["value"]: opt for opt in persona_options}
+        initial_values = {}
+        initial_selections = {}
+        selector_options = {
+            "ab_persona_a_selector": (persona_options, None),
+            "ab_persona_b_selector": (persona_options, None),
+        }
+
+        if persona_a_data:
+            initial_values["ab_a_name_input"] = persona_a_data["name"]
+            initial_selections["ab_a_model_select"] = persona_a_data["model"]
+            initial_selections["ab_a_temperature_select"] = str(persona_a_data["temperature"])
+            selector_options["ab_persona_a_selector"] = (
+                persona_options,
+                persona_options_by_value.get(str(persona_a_data["id"])),
+            )
+
+        if persona_b_data:
+            initial_values["ab_b_name_input"] = persona_b_data["name"]
+            initial_selections["ab_b_model_select"] = persona_b_data["model"]
+            initial_selections["ab_b_temperature_select"] = str(persona_b_data["temperature"])
+            selector_options["ab_persona_b_selector"] = (
+                persona_options,
+                persona_options_by_value.get(str(persona_b_data["id"])),
+            )
+
+        _view_populator("ab_config_modal")(
+            modal,
+            initial_values=initial_values,
+            initial_selections=initial_selections,
+            selector_options=selector_options,
+        )
         
         # Open the modal
         slack_client.views_open(
@@ -1562,13 +1792,44 @@ def handle_configure_ab_testing_modal(payload: Dict[str, Any], action: Dict[str,
         
     except Exception as e:
         logger.error(f"Error opening A/B testing modal: {e}")
-        slack_client.chat_postMessage(
-            channel=user_id,
-            text="❌ Failed to open A/B testing configuration modal. Please try again."
+        slack_post_executor.submit(
+            _post_message_in_background,
+            user_id,
+            "❌ Failed to open A/B testing configuration modal. Please try again."
         )
         return jsonify({"error": "Failed to open modal"}), 500
 
 
+# Delete-confirmation blocks built once at import; handle_delete_persona
+# deep-copies this and fills in the two persona-specific fields per call
+_DELETE_CONFIRM_BLOCKS = [
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": ""  # filled in with the persona name per call
+        }
+    },
+    {
+        "type": "actions",
+        "elements": [
+            {
+                "type": "button",
+                "text": {"type": "plain_text", "text": "🗑️ Yes, Delete"},
+                "action_id": "confirm_delete_persona",
+                "style": "danger",
+                "value": ""  # filled in with the persona id per call
+            },
+            {
+                "type": "button",
+                "text": {"type": "plain_text", "text": "Cancel"},
+                "action_id": "cancel_delete_persona"
+            }
+        ]
+    }
+]
+
+
 def handle_delete_persona(payload: Dict[str, Any], action: Dict[str, Any]) -> Any:
     """Handle persona deletion with confirmation."""
     try:
@@ -1588,32 +1849,12 @@ def handle_delete_persona(payload: Dict[str, Any], action: Dict[str, Any]) -> An
             return jsonify({"status": "ok"})
         
         # Send confirmation message with buttons
-        confirmation_blocks = [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"⚠️ *Are you sure you want to delete the persona '{active_persona['name']}'?*\n\nThis action cannot be undone."
-                }
-            },
-            {
-                "type": "actions",
-                "elements": [
-                    {
-                        "type": "button",
-                        "text": {"type": "plain_text", "text": "🗑️ Yes, Delete"},
-                        "action_id": "confirm_delete_persona",
-                        "style": "danger",
-                        "value": str(active_persona["id"])
-                    },
-                    {
-                        "type": "button",
-                        "text": {"type": "plain_text", "text": "Cancel"},
-                        "action_id": "cancel_delete_persona"
-                    }
-                ]
-            }
-        ]
+        confirmation_blocks = copy.deepcopy(_DELETE_CONFIRM_BLOCKS)
+        confirmation_blocks[0]["text"]["text"] = (
+            f"⚠️ *Are you sure you want to delete the persona '{active_persona['name']}'?*"
+            f"\n\nThis action cannot be undone."
+        )
+        confirmation_blocks[1]["elements"][0]["value"] = str(active_persona["id"])
         
         slack_client.chat_postMessage(
             channel=user_id,
@@ -1625,13 +1866,85 @@ def handle_delete_persona(payload: Dict[str, Any], action: Dict[str, Any]) -> An
         
     except Exception as e:
         logger.error(f"Error handling persona deletion: {e}")
-        slack_client.chat_postMessage(
-            channel=user_id,
-            text="❌ Failed to process delete request. Please try again."
+        slack_post_executor.submit(
+            _post_message_in_background,
+            user_id,
+            "❌ Failed to process delete request. Please try again."
         )
         return jsonify({"error": "Failed to process delete request"}), 500
 
 
+# Write-behind queue for A/B votes: the interactive handler enqueues and acks
+# Slack immediately, and a single worker drains the queue committing votes in
+# batches, so a voting burst costs one commit per batch instead of one per vote
+_vote_queue = queue.Queue()
+_VOTE_FLUSH_INTERVAL = 0.1  # seconds
+_VOTE_FLUSH_MAX_BATCH = 50
+
+
+def _apply_vote(test_id: int, user_id: str, variant: str) -> None:
+    """Apply one vote to the session (UPDATE in place, INSERT when new)."""
+    updated = ABVote.query.filter_by(test_id=test_id, user_id=user_id).update(
+        {'chosen_variant': variant}
+    )
+    if not updated:
+        db.session.add(ABVote(test_id=test_id, user_id=user_id, chosen_variant=variant))
+
+
+def _vote_writer_loop() -> None:
+    """Drain queued votes and commit them in batches."""
+    import time
+
+    while True:
+        votes = [_vote_queue.get()]
+        deadline = time.monotonic() + _VOTE_FLUSH_INTERVAL
+        while len(votes) < _VOTE_FLUSH_MAX_BATCH:
+            try:
+                votes.append(_vote_queue.get(timeout=max(0.0, deadline - time.monotonic())))
+            except queue.Empty:
+                break
+
+        # Last vote wins if the same voter appears twice in one batch
+        deduped = {(test_id, user_id): (test_id, user_id, variant)
+                   for test_id, user_id, variant in votes}
+
+        with app.app_context():
+            try:
+                for test_id, user_id, variant in deduped.values():
+                    _apply_vote(test_id, user_id, variant)
+                db.session.commit()
+                logger.info(f"Committed batch of {len(deduped)} vote(s)")
+            except Exception as e:
+                # One bad row (e.g. FK violation after a test was deleted)
+                # must not discard the rest of the batch - every voter was
+                # already acked. Retry each vote in its own transaction so
+                # only the offending one is dropped.
+                logger.error(f"Vote batch write failed, retrying individually: {e}")
+                db.session.rollback()
+                for test_id, user_id, variant in deduped.values():
+                    try:
+                        _apply_vote(test_id, user_id, variant)
+                        db.session.commit()
+                    except Exception as vote_error:
+                        logger.error(
+                            f"Dropping vote (test={test_id}, user={user_id}, "
+                            f"variant={variant}): {vote_error}"
+                        )
+                        db.session.rollback()
+
+
+_vote_writer = threading.Thread(target=_vote_writer_loop, name="vote-writer", daemon=True)
+_vote_writer.start()
+
+
+def _post_message_in_background(channel_id: str, text: str, thread_ts: str = None) -> None:
+    """Post a Slack message from the shared executor, logging any failure."""
+    try:
+        slack_client.chat_postMessage(channel=channel_id, text=text, thread_ts=thread_ts)
+    except Exception as e:
+        logger.error(f"Background Slack post to {channel_id} failed: {e}")
+
+
 def handle_ab_vote(payload: Dict[str, Any], action: Dict[str, Any]) -> Any:
     """Handle A/B test voting."""
     try:
@@ -1645,41 +1958,26 @@ def handle_ab_vote(payload: Dict[str, Any], action: Dict[str, Any]) -> Any:
             logger.error("Missing required vote data")
             return jsonify({"error": "Invalid vote data"}), 400
         
-        # Check if user already voted
-        existing_vote = ABVote.query.filter_by(
-            test_id=test_id, 
-            user_id=voter_user_id
-        ).first()
-        
-        if existing_vote:
-            # Update existing vote
-            existing_vote.chosen_variant = variant
-            logger.info(f"Updated vote for user {voter_user_id} in test {test_id} to variant {variant}")
-        else:
-            # Create new vote
-            new_vote = ABVote(
-                test_id=test_id,
-                user_id=voter_user_id,
-                chosen_variant=variant
-            )
-            db.session.add(new_vote)
-            logger.info(f"Created new vote for user {voter_user_id} in test {test_id} for variant {variant}")
-        
-        db.session.commit()
-        
-        # Send confirmation message
+        # Hand the vote to the write-behind worker and ack immediately; the
+        # worker batches commits so bursts don't pay one fsync per vote
+        _vote_queue.put((test_id, voter_user_id, variant))
+        logger.info(f"Queued vote for user {voter_user_id} in test {test_id} for variant {variant}")
+
+        # Send confirmation message in the background - Slack only needs the
+        # 200 ack, not the confirmation post, within its 3 second window
         channel_id = payload.get("channel", {}).get("id")
         user_id = payload.get("user", {}).get("id")
         persona_name = vote_data.get("persona_name", variant)
-        
+
         confirmation_text = f"<@{user_id}> Thanks for your feedback! You voted for Response {variant} ({persona_name})."
-        
-        slack_client.chat_postMessage(
-            channel=channel_id,
-            text=confirmation_text,
-            thread_ts=payload.get("message", {}).get("thread_ts")
+
+        slack_post_executor.submit(
+            _post_message_in_background,
+            channel_id,
+            confirmation_text,
+            payload.get("message", {}).get("thread_ts")
         )
-        
+
         return jsonify({"status": "ok"})
         
     except Exception as e:
@@ -1687,6 +1985,36 @@ def handle_ab_vote(payload: Dict[str, Any], action: Dict[str, Any]) -> Any:
         return jsonify({"error": "Failed to process vote"}), 500
 
 
+# Maps interactive action_ids to their handlers, built once at import time so
+# /interactive does a single dict lookup instead of walking an if/elif chain.
+# Handlers that only take the payload are wrapped to the common signature.
+ACTION_HANDLERS = {
+    # Voting actions
+    "vote_a": handle_ab_vote,
+    "vote_b": handle_ab_vote,
+    # Mode selection
+    "mode_selector": handle_mode_selection,
+    # A/B persona selections
+    "ab_persona_a_selector": handle_ab_persona_selection,
+    "ab_persona_b_selector": handle_ab_persona_selection,
+    # Chat persona selection
+    "chat_persona_selector": handle_chat_persona_selection,
+    # Settings save actions
+    "save_ab_settings": lambda payload, action: handle_save_ab_settings(payload),
+    # Persona management actions
+    "view_personas": handle_persona_management,
+    "create_persona": handle_persona_management,
+    "view_analytics": handle_persona_management,
+    # Modal-based editing actions
+    "edit_chat_persona": handle_edit_chat_persona_modal,
+    "configure_ab_testing": handle_configure_ab_testing_modal,
+    "delete_persona": handle_delete_persona,
+    # Inline persona editing actions (legacy)
+    "save_chat_persona": lambda payload, action: handle_save_chat_persona(payload),
+    "save_ab_configuration": lambda payload, action: handle_save_ab_configuration(payload),
+}
+
+
 # ==========================================
 # ERROR TRACKING AND MONITORING
 # ==========================================
@@ -1694,17 +2022,54 @@ def handle_ab_vote(payload: Dict[str, Any], action: Dict[str, Any]) -> Any:
 # Health check endpoint
 @app.route("/health", methods=["GET"])
 def health_check():
-    """Health check endpoint to verify app and database status."""
-    try:
-        # Test database connection using newer SQLAlchemy API
-        from sqlalchemy import text
-        with app.app_context():
+    """Liveness probe - answers immediately without touching the database.
+
+    Load balancers hit this every few seconds; each probe used to run a
+    SELECT 1 against the DB, taking a pooled connection away from real
+    traffic. Database connectivity is checked by /ready and /status instead.
+    """
+    return jsonify({"status": "healthy"}), 200
+
+
+# Cache for the readiness DB check so concurrent probes share one query
+_db_check_lock = threading.Lock()
+_db_check_cache = {'timestamp': 0.0, 'healthy': False, 'error': None}
+_DB_CHECK_TTL_SECONDS = 5
+
+
+def _check_database_ready():
+    """Run SELECT 1 against the database, caching the result for a few seconds."""
+    import time
+
+    with _db_check_lock:
+        now = time.time()
+        if now - _db_check_cache['timestamp'] < _DB_CHECK_TTL_SECONDS:
+            return _db_check_cache['healthy'], _db_check_cache['error']
+
+        try:
+            from sqlalchemy import text
             db.session.execute(text('SELECT 1'))
-            db.session.commit()
-        return jsonify({"status": "healthy", "database": "connected"}), 200
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return jsonify({"status": "unhealthy", "database": "disconnected", "error": str(e)}), 503
+            _db_check_cache.update(timestamp=now, healthy=True, error=None)
+        except Exception as e:
+            logger.error(f"Readiness check failed: {e}")
+            _db_check_cache.update(timestamp=now, healthy=False, error=str(e))
+
+        return _db_check_cache['healthy'], _db_check_cache['error']
+
+
+@app.route("/ready", methods=["GET"])
+def readiness_check():
+    """Readiness probe - verifies database connectivity (result cached briefly)."""
+    healthy, error = _check_database_ready()
+    if healthy:
+        return jsonify({"status": "ready", "database": "connected"}), 200
+    return jsonify({"status": "not_ready", "database": "disconnected", "error": error}), 503
+
+# Cached user count for /status; COUNT(*) scans the whole table, so
+# successive probes share one query instead of re-counting every time
+_user_count_cache = {'timestamp': 0.0, 'count': None}
+_USER_COUNT_TTL_SECONDS = 30
+
 
 # Additional monitoring endpoints
 @app.route("/status", methods=["GET"])
@@ -1718,14 +2083,20 @@ def status_check():
         db_status = "unknown"
         db_latency = None
         try:
+            # Route handlers already run inside an app context, so there is
+            # no need to push another one just to touch the session
             from sqlalchemy import text
             db_start = time.time()
-            with app.app_context():
-                result = db.session.execute(text('SELECT COUNT(*) FROM user_preferences'))
-                row_count = result.scalar()
-                db.session.commit()
+            db.session.execute(text('SELECT 1'))
             db_latency = round((time.time() - db_start) * 1000, 2)  # ms
             db_status = "connected"
+
+            # Refresh the user count at most every 30 seconds
+            now = time.time()
+            if now - _user_count_cache['timestamp'] >= _USER_COUNT_TTL_SECONDS:
+                result = db.session.execute(text('SELECT COUNT(*) FROM user_preferences'))
+                _user_count_cache.update(timestamp=now, count=result.scalar())
+            row_count = _user_count_cache['count']
         except Exception as e:
             db_status = f"error: {str(e)[:100]}"
         
@@ -1770,59 +2141,78 @@ def status_check():
             "timestamp": time.time()
         }), 500
 
+# Monitoring endpoints excluded from request/response logging; frozenset gives
+# O(1) membership checks in the before/after hooks that run on every request
+_LOG_SKIP_PATHS = frozenset({'/health', '/ready', '/status', '/errors'})
+
+
 # Request logging middleware
 @app.before_request
 def log_request_info():
     """Log request information for debugging."""
     # Skip logging for health checks to avoid noise
-    if request.path in ['/health', '/status']:
+    if request.path in _LOG_SKIP_PATHS:
         return
-        
-    logger.info(f"Request: {request.method} {request.path} from {request.remote_addr}")
-    
+
+    # %-style args defer formatting (and the remote_addr header parse) until
+    # the logger has confirmed INFO is enabled
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    logger.info("Request: %s %s from %s", request.method, request.path, request.remote_addr)
+
     # Log payload size for POST requests
     if request.method == 'POST' and request.content_length:
-        logger.info(f"Request size: {request.content_length} bytes")
+        logger.info("Request size: %s bytes", request.content_length)
 
 @app.after_request
 def log_response_info(response):
     """Log response information."""
     # Skip logging for health checks
-    if request.path in ['/health', '/status']:
+    if request.path in _LOG_SKIP_PATHS:
         return response
-        
-    logger.info(f"Response: {response.status_code} for {request.method} {request.path}")
-    
+
+    logger.info("Response: %s for %s %s", response.status_code, request.method, request.path)
+
     # Log errors with more detail
     if response.status_code >= 400:
-        logger.warning(f"Error response {response.status_code}: {request.method} {request.path}")
-    
+        logger.warning("Error response %s: %s %s", response.status_code, request.method, request.path)
+
     return response
 
 # Simple error tracking (in memory - for basic monitoring)
+# deque(maxlen=50) evicts the oldest entry in O(1); list.pop(0) is O(n)
 error_tracker = {
-    'recent_errors': [],
-    'error_counts': {}
+    'recent_errors': collections.deque(maxlen=50),
+    'error_counts': collections.Counter()
 }
 
 def track_error(error_type, error_message, error_id=None):
-    """Track errors for monitoring."""
+    """Track errors for monitoring, coalescing back-to-back repeats."""
     import time
-    
-    error_entry = {
-        'timestamp': time.time(),
-        'type': error_type,
-        'message': error_message[:200],  # Truncate long messages
-        'error_id': error_id
-    }
-    
-    # Keep only last 50 errors
-    error_tracker['recent_errors'].append(error_entry)
-    if len(error_tracker['recent_errors']) > 50:
-        error_tracker['recent_errors'].pop(0)
-    
+
+    message = error_message[:200]  # Truncate long messages
+    recent = error_tracker['recent_errors']
+
+    # During a fault storm (e.g. DB down) the same error repeats on every
+    # request; bump a counter on the latest entry instead of flooding the
+    # 50-slot buffer with identical lines
+    last = recent[-1] if recent else None
+    if last is not None and last['type'] == error_type and last['message'] == message:
+        last['timestamp'] = time.time()
+        last['count'] += 1
+    else:
+        # Keep only last 50 errors (deque drops the oldest automatically)
+        recent.append({
+            'timestamp': time.time(),
+            'type': error_type,
+            'message': message,
+            'error_id': error_id,
+            'count': 1
+        })
+
     # Count by type
-    error_tracker['error_counts'][error_type] = error_tracker['error_counts'].get(error_type, 0) + 1
+    error_tracker['error_counts'][error_type] += 1
 
 
 @app.route("/errors", methods=["GET"])
@@ -1830,12 +2220,12 @@ def error_summary():
     """Get recent errors summary for monitoring."""
     import time
     
-    # Only show errors from last 24 hours
+    # Only show errors from last 24 hours. Entries are appended in timestamp
+    # order, so binary-search for the cutoff instead of filtering every entry
     cutoff_time = time.time() - (24 * 60 * 60)
-    recent_errors = [
-        error for error in error_tracker['recent_errors'] 
-        if error['timestamp'] > cutoff_time
-    ]
+    errors = list(error_tracker['recent_errors'])
+    start = bisect.bisect_right(errors, cutoff_time, key=lambda e: e['timestamp'])
+    recent_errors = errors[start:]
     
     return jsonify({
         "status": "ok",
@@ -1854,10 +2244,23 @@ def error_summary():
 from werkzeug.exceptions import HTTPException
 import traceback
 
+# Slack-facing endpoints get special treatment in the handlers below; the
+# tuple form lets startswith test both prefixes in a single C-level pass
+SLACK_PREFIXES = ('/event', '/interactive')
+
+
+def _slack_request_user_id():
+    """Extract the Slack user id from the current request's payload."""
+    payload = request.get_json() or {}
+    if request.path.startswith('/interactive'):
+        payload = json.loads(request.form.get("payload", "{}"))
+    return payload.get("user", {}).get("id") or payload.get("event", {}).get("user")
+
+
 @app.errorhandler(500)
 def internal_server_error(e):
     """Handle 500 Internal Server Error."""
-    error_id = f"ERR-{int(os.urandom(4).hex(), 16)}"  # Generate short error ID
+    error_id = f"ERR-{secrets.token_hex(4)}"  # Generate short error ID
     logger.error(f"Internal Server Error [{error_id}]: {e}")
     logger.error(f"Traceback [{error_id}]: {traceback.format_exc()}")
     
@@ -1865,7 +2268,7 @@ def internal_server_error(e):
     track_error("500_internal_error", str(e), error_id)
     
     # Return JSON for API endpoints, HTML for others
-    if request.path.startswith('/event') or request.path.startswith('/interactive'):
+    if request.path.startswith(SLACK_PREFIXES):
         return jsonify({
             "error": "Internal server error",
             "error_id": error_id,
@@ -1921,25 +2324,25 @@ from pymysql.err import OperationalError as PyMySQLOperationalError
 @app.errorhandler(DatabaseError)
 def database_error(e):
     """Handle database connection and operational errors."""
-    error_id = f"DB-ERR-{int(os.urandom(4).hex(), 16)}"
+    error_id = f"DB-ERR-{secrets.token_hex(4)}"
     logger.error(f"DATABASE CONNECTION FAILURE [{error_id}]: {e}")
     
     # Track database error
     track_error("database_connection_failure", str(e), error_id)
     
     # For Slack API endpoints, return 200 but with clear error messaging
-    if request.path.startswith('/event') or request.path.startswith('/interactive'):
+    if request.path.startswith(SLACK_PREFIXES):
         # Try to send user-friendly message to Slack if possible
         try:
-            payload = request.get_json() or {}
-            if request.path.startswith('/interactive'):
-                payload = json.loads(request.form.get("payload", "{}"))
-            
-            user_id = payload.get("user", {}).get("id") or payload.get("event", {}).get("user")
+            user_id = _slack_request_user_id()
             if user_id:
-                slack_client.chat_postMessage(
-                    channel=user_id,
-                    text=f"🚨 **DATABASE CONNECTION FAILURE** [{error_id}]\n\nThe database is currently unreachable. This is causing the persona system to malfunction.\n\n**Error:** {str(e)[:200]}\n\nPlease contact the administrator."
+                # Post from the shared executor - blocking a failing request
+                # on a Slack roundtrip while the DB is already down just
+                # stacks a second outage on top of the first
+                slack_post_executor.submit(
+                    _post_message_in_background,
+                    user_id,
+                    f"🚨 **DATABASE CONNECTION FAILURE** [{error_id}]\n\nThe database is currently unreachable. This is causing the persona system to malfunction.\n\n**Error:** {str(e)[:200]}\n\nPlease contact the administrator."
                 )
         except Exception as slack_error:
             logger.error(f"Failed to send database error message to Slack: {slack_error}")
@@ -1962,7 +2365,7 @@ def handle_exception(e):
         return e
     
     # Handle non-HTTP exceptions
-    error_id = f"UNHANDLED-{int(os.urandom(4).hex(), 16)}"
+    error_id = f"UNHANDLED-{secrets.token_hex(4)}"
     logger.error(f"Unhandled Exception [{error_id}]: {type(e).__name__}: {e}")
     logger.error(f"Traceback [{error_id}]: {traceback.format_exc()}")
     
@@ -1970,17 +2373,14 @@ def handle_exception(e):
     track_error("unhandled_exception", f"{type(e).__name__}: {str(e)}", error_id)
     
     # For Slack endpoints, try to be graceful
-    if request.path.startswith('/event') or request.path.startswith('/interactive'):
+    if request.path.startswith(SLACK_PREFIXES):
         try:
-            payload = request.get_json() or {}
-            if request.path.startswith('/interactive'):
-                payload = json.loads(request.form.get("payload", "{}"))
-            
-            user_id = payload.get("user", {}).get("id") or payload.get("event", {}).get("user")
+            user_id = _slack_request_user_id()
             if user_id:
-                slack_client.chat_postMessage(
-                    channel=user_id,
-                    text="⚠️ I encountered an unexpected error. Please try again."
+                slack_post_executor.submit(
+                    _post_message_in_background,
+                    user_id,
+                    "⚠️ I encountered an unexpected error. Please try again."
                 )
         except Exception as slack_error:
             logger.error(f"Failed to send exception error message to Slack: {slack_error}")
@@ -1994,8 +2394,49 @@ def handle_exception(e):
     }), 500
 
 # Admin Dashboard Routes
-from flask import render_template, flash, redirect, url_for
-from datetime import datetime
+
+# Dashboard stats cache: four full-table COUNT(*)s per page view adds up, so
+# amortize them over a short TTL; admin writes invalidate eagerly
+_admin_stats_cache = {'timestamp': 0.0, 'stats': None}
+_ADMIN_STATS_TTL_SECONDS = 30
+
+
+def _get_admin_stats() -> Dict[str, int]:
+    """Get dashboard counts, recomputing at most every 30 seconds."""
+    import time
+    now = time.time()
+    if (_admin_stats_cache['stats'] is None
+            or now - _admin_stats_cache['timestamp'] >= _ADMIN_STATS_TTL_SECONDS):
+        from sqlalchemy import func, select
+        # One round trip for all four counts. Scalar subqueries in a single
+        # SELECT, not UNION ALL: without ORDER BY, SQL doesn't guarantee
+        # which branch of a compound select comes back in which row, so
+        # positional unpacking would only work by accident
+        counts = db.session.execute(
+            select(
+                select(func.count()).select_from(UserPreferences).scalar_subquery(),
+                select(func.count()).select_from(SystemPrompt).scalar_subquery(),
+                select(func.count()).select_from(AIPersona).scalar_subquery(),
+                select(func.count()).select_from(ABTest).scalar_subquery(),
+            )
+        ).one()
+        _admin_stats_cache.update(
+            timestamp=now,
+            stats={
+                'total_users': counts[0],
+                'total_prompts': counts[1],
+                'total_personas': counts[2],
+                'total_tests': counts[3],
+            },
+        )
+    return _admin_stats_cache['stats']
+
+
+def _invalidate_admin_stats() -> None:
+    """Force the next dashboard hit to recount after an admin write."""
+    _admin_stats_cache['timestamp'] = 0.0
+    _admin_stats_cache['stats'] = None
+
 
 @app.route("/admin")
 def admin_dashboard():
@@ -2003,19 +2444,12 @@ def admin_dashboard():
     Main admin dashboard with overview statistics.
     """
     try:
-        # Get statistics
-        total_users = UserPreferences.query.count()
-        total_prompts = SystemPrompt.query.count()
-        total_personas = AIPersona.query.count()
-        total_tests = ABTest.query.count()
-        
-        stats = {
-            'total_users': total_users,
-            'total_prompts': total_prompts,
-            'total_personas': total_personas,
-            'total_tests': total_tests
-        }
-        
+        # Get statistics (cached with a short TTL)
+        stats = _get_admin_stats()
+        total_users = stats['total_users']
+        total_prompts = stats['total_prompts']
+        total_personas = stats['total_personas']
+
         # Get recent activity (simplified for now)
         recent_activity = [
             {
@@ -2048,50 +2482,63 @@ def admin_users():
     User preferences management page.
     """
     try:
-        # Get all user preferences with related persona names
-        users = db.session.query(UserPreferences).all()
-        
+        # Paginate so the page never materializes the whole table; fetching
+        # one extra row tells us whether a next page exists
+        page = max(request.args.get('page', 1, type=int), 1)
+        page_size = min(max(request.args.get('page_size', 100, type=int), 1), 500)
+
+        # with_entities returns plain named tuples with just the listed
+        # columns - no ORM instance bookkeeping for rows we only display
+        users = (UserPreferences.query
+                 .with_entities(
+                     UserPreferences.user_id,
+                     UserPreferences.chat_mode_enabled,
+                     UserPreferences.active_persona_id,
+                     UserPreferences.ab_testing_persona_a_id,
+                     UserPreferences.ab_testing_persona_b_id,
+                     UserPreferences.created_at,
+                     UserPreferences.updated_at,
+                 )
+                 .order_by(UserPreferences.user_id)
+                 .offset((page - 1) * page_size)
+                 .limit(page_size + 1)
+                 .all())
+        has_next = len(users) > page_size
+        users = users[:page_size]
+
+        # Fetch every persona once; the edit form needs the full list anyway,
+        # so resolving the per-user names from a dict turns the old 3N+1
+        # SELECTs into two. Only id and name are displayed, so skip the rest
+        available_personas = AIPersona.query.with_entities(
+            AIPersona.id, AIPersona.name
+        ).all()
+        persona_names_by_id = {p.id: p.name for p in available_personas}
+
         # Prepare user data with persona names
         user_data = []
         for user in users:
-            active_persona_name = None
-            ab_persona_a_name = None
-            ab_persona_b_name = None
-            
-            if user.active_persona_id:
-                active_persona = AIPersona.query.get(user.active_persona_id)
-                active_persona_name = active_persona.name if active_persona else None
-                
-            if user.ab_testing_persona_a_id:
-                persona_a = AIPersona.query.get(user.ab_testing_persona_a_id)
-                ab_persona_a_name = persona_a.name if persona_a else None
-                
-            if user.ab_testing_persona_b_id:
-                persona_b = AIPersona.query.get(user.ab_testing_persona_b_id)
-                ab_persona_b_name = persona_b.name if persona_b else None
-            
             user_data.append({
                 'user_id': user.user_id,
                 'chat_mode_enabled': user.chat_mode_enabled,
-                'active_persona': active_persona_name,
-                'ab_persona_a': ab_persona_a_name,
-                'ab_persona_b': ab_persona_b_name,
+                'active_persona': persona_names_by_id.get(user.active_persona_id),
+                'ab_persona_a': persona_names_by_id.get(user.ab_testing_persona_a_id),
+                'ab_persona_b': persona_names_by_id.get(user.ab_testing_persona_b_id),
                 'created_at': user.created_at,
                 'updated_at': user.updated_at,
                 'active_persona_id': user.active_persona_id,
                 'ab_testing_persona_a_id': user.ab_testing_persona_a_id,
                 'ab_testing_persona_b_id': user.ab_testing_persona_b_id
             })
-        
-        # Get all available personas for the edit form
-        available_personas = AIPersona.query.all()
-        
-        return render_template('admin_users.html', users=user_data, available_personas=available_personas)
-        
+
+        return render_template('admin_users.html', users=user_data,
+                               available_personas=available_personas,
+                               page=page, has_next=has_next)
+
     except Exception as e:
         logger.error(f"Error loading users page: {e}")
         flash('Error loading users', 'error')
-        return render_template('admin_users.html', users=[], available_personas=[])
+        return render_template('admin_users.html', users=[], available_personas=[],
+                               page=1, has_next=False)
 
 @app.route("/admin/users/<user_id>", methods=['GET'])
 def admin_user_get(user_id):
@@ -2131,8 +2578,7 @@ def admin_user_update(user_id):
         user.active_persona_id = request.form.get('active_persona_id') or None
         user.ab_testing_persona_a_id = request.form.get('ab_testing_persona_a_id') or None
         user.ab_testing_persona_b_id = request.form.get('ab_testing_persona_b_id') or None
-        user.updated_at = datetime.utcnow()
-        
+
         db.session.commit()
         flash(f'Updated preferences for user {user_id}', 'success')
         
@@ -2149,15 +2595,18 @@ def admin_user_delete(user_id):
     Delete user preferences.
     """
     try:
-        user = UserPreferences.query.filter_by(user_id=user_id).first()
-        if not user:
+        # Single DELETE ... WHERE; the rowcount doubles as the existence check
+        deleted = db.session.query(UserPreferences).filter_by(
+            user_id=user_id
+        ).delete(synchronize_session=False)
+        if not deleted:
             return jsonify({'error': 'User not found'}), 404
-        
-        db.session.delete(user)
+
         db.session.commit()
-        
+        _invalidate_admin_stats()
+
         return jsonify({'success': True})
-        
+
     except Exception as e:
         logger.error(f"Error deleting user {user_id}: {e}")
         db.session.rollback()
@@ -2169,13 +2618,35 @@ def admin_prompts():
     System prompts management page.
     """
     try:
-        prompts = SystemPrompt.query.order_by(SystemPrompt.is_default.desc(), SystemPrompt.usage_count.desc()).all()
-        return render_template('admin_prompts.html', prompts=prompts)
-        
+        page = max(request.args.get('page', 1, type=int), 1)
+        page_size = min(max(request.args.get('page_size', 100, type=int), 1), 500)
+
+        # Named-tuple rows with only the columns the table shows
+        prompts = (SystemPrompt.query
+                   .with_entities(
+                       SystemPrompt.id,
+                       SystemPrompt.user_id,
+                       SystemPrompt.title,
+                       SystemPrompt.description,
+                       SystemPrompt.content,
+                       SystemPrompt.is_default,
+                       SystemPrompt.usage_count,
+                       SystemPrompt.created_at,
+                   )
+                   .order_by(SystemPrompt.is_default.desc(), SystemPrompt.usage_count.desc())
+                   .offset((page - 1) * page_size)
+                   .limit(page_size + 1)
+                   .all())
+        has_next = len(prompts) > page_size
+        prompts = prompts[:page_size]
+
+        return render_template('admin_prompts.html', prompts=prompts,
+                               page=page, has_next=has_next)
+
     except Exception as e:
         logger.error(f"Error loading prompts page: {e}")
         flash('Error loading prompts', 'error')
-        return render_template('admin_prompts.html', prompts=[])
+        return render_template('admin_prompts.html', prompts=[], page=1, has_next=False)
 
 @app.route("/admin/prompts/create", methods=['GET', 'POST'])
 def admin_prompts_create():
@@ -2211,7 +2682,8 @@ def admin_prompts_create():
                 system_prompt = SystemPrompt.query.get(prompt['id'])
                 system_prompt.is_default = True
                 db.session.commit()
-            
+
+            _invalidate_admin_stats()
             flash(f'Successfully created prompt "{title}"', 'success')
             return redirect(url_for('admin_prompts'))
             
@@ -2254,8 +2726,7 @@ def admin_prompt_update(prompt_id):
         prompt.title = request.form.get('title', prompt.title)
         prompt.description = request.form.get('description', prompt.description)
         prompt.content = request.form.get('content', prompt.content)
-        prompt.updated_at = datetime.utcnow()
-        
+
         db.session.commit()
         
         return jsonify({'success': True})
@@ -2271,16 +2742,21 @@ def admin_prompt_delete(prompt_id):
     Delete system prompt.
     """
     try:
-        prompt = SystemPrompt.query.get_or_404(prompt_id)
-        
         # Check if prompt is in use by any personas
         personas_using = AIPersona.query.filter_by(system_prompt_id=prompt_id).count()
         if personas_using > 0:
             return jsonify({'error': f'Cannot delete prompt. It is being used by {personas_using} personas.'}), 400
-        
-        db.session.delete(prompt)
+
+        # Single DELETE ... WHERE; the rowcount doubles as the existence check
+        deleted = db.session.query(SystemPrompt).filter_by(
+            id=prompt_id
+        ).delete(synchronize_session=False)
+        if not deleted:
+            return jsonify({'error': 'Prompt not found'}), 404
+
         db.session.commit()
-        
+        _invalidate_admin_stats()
+
         return jsonify({'success': True})
         
     except Exception as e:
@@ -2294,19 +2770,29 @@ def admin_personas():
     AI personas management page.
     """
     try:
-        # Query directly since PersonaManager.get_user_personas expects specific user
-        personas_query = AIPersona.query.order_by(AIPersona.is_favorite.desc(), AIPersona.usage_count.desc()).all()
-        personas = [PersonaManager._persona_to_dict(p) for p in personas_query]
-        
+        page = max(request.args.get('page', 1, type=int), 1)
+        page_size = min(max(request.args.get('page_size', 100, type=int), 1), 500)
+
+        # Eager-loads system prompts so the dict conversion doesn't lazy-load
+        # one prompt per persona
+        personas = PersonaManager.list_all_with_prompts(
+            limit=page_size + 1, offset=(page - 1) * page_size
+        )
+        has_next = len(personas) > page_size
+        personas = personas[:page_size]
+
         # Get available prompts for editing
         available_prompts = SystemPrompt.query.all()
         
-        return render_template('admin_personas.html', personas=personas, available_prompts=available_prompts)
-        
+        return render_template('admin_personas.html', personas=personas,
+                               available_prompts=available_prompts,
+                               page=page, has_next=has_next)
+
     except Exception as e:
         logger.error(f"Error loading personas page: {e}")
         flash('Error loading personas', 'error')
-        return render_template('admin_personas.html', personas=[], available_prompts=[])
+        return render_template('admin_personas.html', personas=[], available_prompts=[],
+                               page=1, has_next=False)
 
 @app.route("/admin/personas/create", methods=['GET', 'POST'])
 def admin_personas_create():
@@ -2340,6 +2826,7 @@ def admin_personas_create():
                 flash('Failed to create persona. Name might already exist for this user.', 'error')
                 return render_template('admin_personas_create.html', available_prompts=SystemPrompt.query.all())
             
+            _invalidate_admin_stats()
             flash(f'Successfully created persona "{name}"', 'success')
             return redirect(url_for('admin_personas'))
             
@@ -2403,20 +2890,29 @@ def admin_persona_delete(persona_id):
     Delete AI persona.
     """
     try:
-        persona = AIPersona.query.get_or_404(persona_id)
-        
-        # Check if persona is in use by user preferences
-        active_users = UserPreferences.query.filter_by(active_persona_id=persona_id).count()
-        ab_a_users = UserPreferences.query.filter_by(ab_testing_persona_a_id=persona_id).count()
-        ab_b_users = UserPreferences.query.filter_by(ab_testing_persona_b_id=persona_id).count()
-        
-        total_usage = active_users + ab_a_users + ab_b_users
+        # Check if persona is in use by user preferences - one aggregate
+        # query instead of three separate COUNT(*) roundtrips
+        from sqlalchemy import case, func
+        row = db.session.query(
+            func.sum(case((UserPreferences.active_persona_id == persona_id, 1), else_=0)),
+            func.sum(case((UserPreferences.ab_testing_persona_a_id == persona_id, 1), else_=0)),
+            func.sum(case((UserPreferences.ab_testing_persona_b_id == persona_id, 1), else_=0)),
+        ).one()
+
+        total_usage = sum(int(count or 0) for count in row)
         if total_usage > 0:
             return jsonify({'error': f'Cannot delete persona. It is being used by {total_usage} user configurations.'}), 400
-        
-        db.session.delete(persona)
+
+        # Single DELETE ... WHERE; the rowcount doubles as the existence check
+        deleted = db.session.query(AIPersona).filter_by(
+            id=persona_id
+        ).delete(synchronize_session=False)
+        if not deleted:
+            return jsonify({'error': 'Persona not found'}), 404
+
         db.session.commit()
-        
+        _invalidate_admin_stats()
+
         return jsonify({'success': True})
         
     except Exception as e:
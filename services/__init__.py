@@ -1,19 +1,32 @@
-from .anthropic import get_standard_claude_response
-from .slack import get_conversation_history
-from .ab_testing import ABTestingService
-from .user_preferences import UserPreferencesService
-from .persona_manager import PersonaManager
-from .chat_service import ChatService
-from .system_prompt_manager import SystemPromptManager
-from .persona_creation_service import PersonaCreationService
+"""Service layer exports.
 
-__all__ = [
-    'get_conversation_history',
-    'get_standard_claude_response',
-    'ABTestingService',
-    'UserPreferencesService',
-    'PersonaManager',
-    'ChatService',
-    'SystemPromptManager',
-    'PersonaCreationService'
-]
+Exports resolve lazily (PEP 562) so importing one service doesn't drag in
+every sibling module and its transitive dependencies - e.g. a script that
+only needs PersonaManager no longer pays for loading the anthropic SDK at
+import time. Each name is materialized into the module namespace on first
+access, so the lookup cost is paid once.
+"""
+
+_EXPORTS = {
+    'get_standard_claude_response': 'services.anthropic',
+    'get_conversation_history': 'services.slack',
+    'ABTestingService': 'services.ab_testing',
+    'UserPreferencesService': 'services.user_preferences',
+    'PersonaManager': 'services.persona_manager',
+    'ChatService': 'services.chat_service',
+    'SystemPromptManager': 'services.system_prompt_manager',
+    'PersonaCreationService': 'services.persona_creation_service',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
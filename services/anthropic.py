@@ -1,5 +1,12 @@
+import hashlib
+import json
+import logging
 import os
-from typing import Dict, List
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, List
 
 import anthropic
 from dotenv import load_dotenv
@@ -15,103 +22,225 @@ if not api_key:
     logger.error("CRITICAL: ANTHROPIC_API_KEY environment variable is not set!")
     logger.error("Please ensure your environment contains ANTHROPIC_API_KEY=your_api_key_here")
 
-claude = anthropic.Anthropic(api_key=api_key)
+# One client for the whole process: the SDK's default httpx transport pools
+# connections (1000 max, 100 keepalive) so concurrent A/B calls reuse warm
+# TLS sessions instead of re-handshaking. HTTP/2 multiplexing would need the
+# h2 extra, which isn't one of this project's dependencies.
+#
+# The timeout replaces the SDK's 10-minute default so a stuck call can't pin
+# a worker thread: responses stream, so it bounds the connect and the gap
+# between chunks - not total generation time - and the SDK retries timed-out
+# or dropped requests up to max_retries with backoff before surfacing an
+# error.
+claude = anthropic.Anthropic(api_key=api_key, timeout=30.0, max_retries=2)
 
 MODELS = {
+    "haiku": "claude-3-5-haiku-latest",
     "sonnet": "claude-sonnet-4-20250514",
     "opus": "claude-opus-4-20250514",
 }
 
-# Cache the default system prompt instead of reading file every time
-_DEFAULT_SYSTEM_PROMPT = None
+# Static marker dict shared across all requests' system blocks
+_EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
 
+# Low-temperature calls are effectively deterministic, so identical requests
+# (same model, prompt, conversation and limits) can reuse a recent response
+# instead of paying API latency and spend again. Bounded LRU with a TTL;
+# anything warmer than the threshold always goes to the API.
+_RESPONSE_CACHE_MAX_ENTRIES = 1024
+_RESPONSE_CACHE_TTL_SECONDS = 3600
+_RESPONSE_CACHE_MAX_TEMPERATURE = 0.2
+_response_cache: OrderedDict = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(model_name: str, system_prompt: str, conversation: List[Dict],
+                        temperature: float, max_tokens: int) -> str:
+    payload = json.dumps(
+        (model_name, system_prompt, conversation, temperature, max_tokens),
+        sort_keys=True, default=str
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _response_cache_get(key: str) -> str | None:
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            return None
+        cached_at, text = entry
+        if time.monotonic() - cached_at > _RESPONSE_CACHE_TTL_SECONDS:
+            del _response_cache[key]
+            return None
+        _response_cache.move_to_end(key)
+        return text
+
+
+def _response_cache_put(key: str, text: str) -> None:
+    with _response_cache_lock:
+        _response_cache[key] = (time.monotonic(), text)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+@lru_cache(maxsize=1)
 def _get_default_system_prompt() -> str:
-    """Get default system prompt, loading from file only once."""
-    global _DEFAULT_SYSTEM_PROMPT
-    if _DEFAULT_SYSTEM_PROMPT is None:
-        try:
-            current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            prompt_path = os.path.join(current_dir, "prompts", "assistant_prompt.txt")
-            
-            if os.path.exists(prompt_path):
-                with open(prompt_path, "r") as file:
-                    _DEFAULT_SYSTEM_PROMPT = file.read().strip()
-                logger.info("Loaded default system prompt from file")
-            else:
-                logger.warning(f"Default prompt file not found: {prompt_path}")
-                _DEFAULT_SYSTEM_PROMPT = "You are a helpful AI assistant. Provide clear, accurate, and balanced responses. Be concise but thorough, and always aim to be genuinely helpful to the user."
-                
-        except Exception as e:
-            logger.error(f"Error loading default prompt file: {e}")
-            _DEFAULT_SYSTEM_PROMPT = "You are a helpful AI assistant. Provide clear, accurate, and balanced responses. Be concise but thorough, and always aim to be genuinely helpful to the user."
-    
-    return _DEFAULT_SYSTEM_PROMPT
+    """Get default system prompt, loading from file only once.
+
+    lru_cache gives the read-once semantics with thread-safe first-call
+    initialization, replacing the old global-sentinel dance.
+    """
+    try:
+        current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        prompt_path = os.path.join(current_dir, "prompts", "assistant_prompt.txt")
+
+        if os.path.exists(prompt_path):
+            with open(prompt_path, "r") as file:
+                prompt = file.read().strip()
+            logger.info("Loaded default system prompt from file")
+            return prompt
 
-def get_standard_claude_response(conversation: List[Dict], system_prompt: str|None=None, model_name: str|None=None, temperature: float=1.0, max_tokens: int=2000) -> str | None:
-    """Generate standard text using Claude API."""
+        logger.warning(f"Default prompt file not found: {prompt_path}")
+    except Exception as e:
+        logger.error(f"Error loading default prompt file: {e}")
+
+    return "You are a helpful AI assistant. Provide clear, accurate, and balanced responses. Be concise but thorough, and always aim to be genuinely helpful to the user."
+
+def _join_content_blocks(blocks) -> str:
+    """Join multiple content blocks into one response string.
+
+    Only the multi-block (or citation-bearing) responses come through here;
+    the single-text-block common case is fast-pathed by the caller.
+    """
+    response = []
+    for content in blocks:
+        if content.type != "text":
+            continue
+
+        response.append(content.text)
+
+        # Log citations if present; the attribute always exists on SDK
+        # content blocks, so read it directly instead of hasattr's
+        # try/except round-trip
+        citations = getattr(content, 'citations', None)
+        if citations:
+            logger.info("Citations found: %d citations", len(citations))
+            # The per-citation loop does nothing but log, so skip it
+            # entirely unless DEBUG output is actually enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                for citation in citations:
+                    logger.debug("Citation details: %s", citation)
+            # TODO: think if citations are needed - if so, append
+            # "\t<cited_text>...</cited_text> (from <title>)" lines here
+
+    return "\n".join(response)
+
+
+def get_standard_claude_response(conversation: List[Dict], system_prompt: str|None=None, model_name: str|None=None, temperature: float=1.0, max_tokens: int=2000, on_text: Callable[[str], None]|None=None) -> str | None:
+    """Generate standard text using Claude API.
+
+    The response is streamed from the API; pass on_text to receive each text
+    delta as it arrives (e.g. to push partial updates to Slack) - the full
+    response is still returned once generation finishes.
+    """
     # Use cached default prompt instead of reading file every time
     system_prompt = system_prompt or _get_default_system_prompt()
     model_name = MODELS[model_name] if model_name else MODELS["sonnet"]
     
+    # Guards ordered cheapest-first: the O(1) empty check also lets the
+    # later checks index conversation[-1] unconditionally
+    if not conversation:
+        logger.error(f"EMPTY_CONVERSATION: No messages to process!")
+        return "I didn't receive any messages to respond to."
+
     # Check if conversation already ends with assistant response
-    if conversation and conversation[-1].get("role") == "assistant":
+    if conversation[-1].get("role") == "assistant":
         logger.warning(f"CONVERSATION_ALREADY_COMPLETE: Last message is from assistant!")
         logger.warning(f"This might indicate duplicate processing or conversation history timing issue")
         return None  # Return None to indicate no response needed
-    
-    # Check for empty conversation
-    if not conversation:
-        logger.error(f"EMPTY_CONVERSATION: No messages to process!")
-        return "I didn't receive any messages to respond to."
-    
-    # Check for conversation with only assistant messages
-    user_messages = [msg for msg in conversation if msg.get("role") == "user"]
-    if not user_messages:
+
+    # Check for conversation with only assistant messages; any() stops at
+    # the first user message instead of materializing a filtered list
+    if not any(msg.get("role") == "user" for msg in conversation):
         logger.error(f"NO_USER_MESSAGES: Conversation has no user messages!")
         return "I don't see any user messages to respond to."
 
+    # Only plain-text conversations are cacheable: PDF-bearing threads carry
+    # multi-MB base64 document blocks, and serializing + hashing those on
+    # every call would cost more than the cache saves
+    cache_key = None
+    if (temperature <= _RESPONSE_CACHE_MAX_TEMPERATURE
+            and all(isinstance(msg.get("content"), str) for msg in conversation)):
+        cache_key = _response_cache_key(model_name, system_prompt, conversation, temperature, max_tokens)
+        cached_response = _response_cache_get(cache_key)
+        if cached_response is not None:
+            logger.info("CLAUDE_RESPONSE_CACHE_HIT: length=%d", len(cached_response))
+            if on_text is not None:
+                on_text(cached_response)
+            return cached_response
+
+    # In threads the history up to (but not including) the newest user turn
+    # is a stable prefix across follow-ups, so tag the last history message
+    # with cache_control and the API reuses the cached prefix instead of
+    # reprocessing the whole conversation each turn
+    messages = conversation
+    if len(conversation) >= 3:
+        last_history = conversation[-2]
+        history_text = last_history.get("content")
+        if isinstance(history_text, str):
+            messages = list(conversation)
+            messages[-2] = {
+                **last_history,
+                "content": [{
+                    "type": "text",
+                    "text": history_text,
+                    "cache_control": _EPHEMERAL_CACHE_CONTROL,
+                }],
+            }
+
     try:
-        claude_message = claude.messages.create(
+        # Stream rather than block on the full completion: tokens start
+        # flowing at time-to-first-token, and callers that pass on_text can
+        # surface partial output long before generation finishes
+        with claude.messages.stream(
             model=model_name,
             max_tokens=max_tokens,
-            system=system_prompt,
+            # Structured system block with cache_control so the API caches
+            # the prompt prefix server-side; persona prompts are stable per
+            # user, so repeat calls skip reprocessing those input tokens
+            system=[{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": _EPHEMERAL_CACHE_CONTROL,
+            }],
             temperature=temperature,
-            messages=conversation,
-        )
-        
-        # Handle potential multiple content blocks
-        response = []
-        for content in claude_message.content:
-            if content.type != "text":
-                continue
-                
-            response.append(content.text)
-            
-            # Log and add citations if present
-            if hasattr(content, 'citations') and content.citations:
-                logger.info(f"Citations found: {len(content.citations)} citations")
-                citations = []
-                for citation in content.citations:
-                    logger.debug(f"Citation details: {citation}")
-                    citations.append(
-                        f"\t<cited_text>{citation.cited_text}</cited_text> "
-                        f"(from {citation.document_title})"
-                    )
-                # TODO: think if citations are needed
-                # if citations:
-                #     response.append("\n" + "\n".join(citations))
-        
-        final_response = "\n".join(response)
-        
-        # Log the response details
-        logger.info(f"CLAUDE_RESPONSE: length={len(final_response)}, preview='{final_response[:100]}{'...' if len(final_response) > 100 else ''}'")
+            messages=messages,
+        ) as stream:
+            if on_text is not None:
+                for text in stream.text_stream:
+                    on_text(text)
+            claude_message = stream.get_final_message()
         
+        # Fast path: almost every response is a single plain text block, so
+        # return its text without building a list and joining
+        blocks = claude_message.content
+        if len(blocks) == 1 and blocks[0].type == "text" and not getattr(blocks[0], 'citations', None):
+            final_response = blocks[0].text
+        else:
+            final_response = _join_content_blocks(blocks)
+
+        # %-style args so the preview slice is only built if INFO is enabled
+        logger.info("CLAUDE_RESPONSE: length=%d, preview='%.100s'", len(final_response), final_response)
+
         if not final_response or final_response.strip() == "":
             logger.error(f"EMPTY_CLAUDE_RESPONSE: Claude returned empty response!")
             logger.error(f"Raw response blocks: {[block.text for block in claude_message.content if block.type == 'text']}")
-        
+
+        if cache_key is not None and final_response:
+            _response_cache_put(cache_key, final_response)
+
         return final_response
-        
+
     except anthropic.APIConnectionError as e:
         logger.error(f"Anthropic API connection error: {e}")
         logger.error(f"API Key status - Present: {bool(api_key)}, Prefix: {api_key[:10] if api_key else 'None'}...")
@@ -1,14 +1,20 @@
 import os
-import traceback
-from typing import Dict, List, Optional, Tuple
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 from models import db, UserPreferences
 from services.persona_manager import PersonaManager
 from services.ab_testing import ABTestingService
+from services.user_preferences import UserPreferencesService
 from services.anthropic import get_standard_claude_response
 from utils import setup_logger
 
 logger = setup_logger(__name__)
 
+# Mode is read on every incoming message but switched rarely, so cache it
+# per user for a short window; set_user_mode drops the entry on write
+_USER_MODE_TTL_SECONDS = 60
+_user_mode_cache: Dict[str, Tuple[float, str]] = {}
+
 
 class ChatService:
     """Service for handling chat interactions in both A/B testing and chat mode."""
@@ -16,11 +22,17 @@ class ChatService:
     @staticmethod
     def get_user_mode(user_id: str) -> str:
         """Get the user's preferred mode (chat_mode or ab_testing)."""
+        cached = _user_mode_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < _USER_MODE_TTL_SECONDS:
+            return cached[1]
+
         try:
-            user_prefs = UserPreferences.query.filter_by(user_id=user_id).first()
-            if user_prefs and not user_prefs.chat_mode_enabled:
-                return "ab_testing"
-            return "chat_mode"  # Default to chat mode
+            row = UserPreferences.query.filter_by(user_id=user_id).with_entities(
+                UserPreferences.chat_mode_enabled
+            ).first()
+            mode = "ab_testing" if row and not row.chat_mode_enabled else "chat_mode"
+            _user_mode_cache[user_id] = (time.monotonic(), mode)
+            return mode
         except Exception as e:
             logger.error(f"Error getting user mode for {user_id}: {e}")
             return "chat_mode"  # Default to chat mode on error
@@ -36,7 +48,8 @@ class ChatService:
             
             user_prefs.chat_mode_enabled = (mode == "chat_mode")
             db.session.commit()
-            
+            _user_mode_cache.pop(user_id, None)
+
             logger.info(f"Set mode to {mode} for user {user_id}")
             return True
             
@@ -46,11 +59,16 @@ class ChatService:
             return False
     
     @staticmethod
-    def handle_user_message(user_id: str, channel_id: str, thread_ts: str, 
-                          message_text: str, conversation: List[Dict]) -> Dict | None:
+    def handle_user_message(user_id: str, channel_id: str, thread_ts: str,
+                          message_text: str, conversation: List[Dict],
+                          on_text: Optional[Callable[[str], None]] = None,
+                          on_ab_response: Optional[Callable[[str, str], None]] = None) -> Dict | None:
         """
         Handle a user message and return appropriate response(s) based on mode.
-        
+
+        on_text receives streamed text deltas in chat mode; on_ab_response
+        receives (variant, text) as each A/B variant finishes generating.
+
         Returns:
             Dict with keys:
                 - mode: "chat_mode" or "ab_testing"
@@ -59,30 +77,27 @@ class ChatService:
         """
         try:
             mode = ChatService.get_user_mode(user_id)
-            
+
             if mode == "chat_mode":
-                return ChatService._handle_chat_mode(user_id, channel_id, thread_ts, message_text, conversation)
+                return ChatService._handle_chat_mode(user_id, channel_id, thread_ts, message_text, conversation, on_text=on_text)
             else:
-                return ChatService._handle_ab_testing_mode(user_id, channel_id, thread_ts, message_text, conversation)
+                return ChatService._handle_ab_testing_mode(user_id, channel_id, thread_ts, message_text, conversation, on_ab_response=on_ab_response)
                 
         except Exception as e:
-            # Enhanced error logging
-            error_details = {
-                "user_id": user_id,
-                "channel_id": channel_id,
-                "thread_ts": thread_ts,
-                "message_length": len(message_text) if message_text else 0,
-                "conversation_length": len(conversation) if conversation else 0,
-                "error_type": type(e).__name__,
-                "error_message": str(e),
-                "anthropic_api_key_present": bool(os.environ.get("ANTHROPIC_API_KEY")),
-                "anthropic_api_key_prefix": os.environ.get("ANTHROPIC_API_KEY", "")[:10] if os.environ.get("ANTHROPIC_API_KEY") else "None"
-            }
-            
-            # Log full error details
+            # Log the context with deferred %-formatting and let the logger
+            # render the traceback; the caller gets only a minimal error
+            # marker (the old payload echoed the API-key prefix back out)
             logger.error(f"CRITICAL ERROR handling message for user {user_id}: {e}")
-            logger.error(f"Error Details: {error_details}")
-            logger.error(f"Full Traceback:\n{traceback.format_exc()}")
+            logger.error(
+                "Error details: user=%s channel=%s thread=%s message_length=%d "
+                "conversation_length=%d error_type=%s api_key_present=%s",
+                user_id, channel_id, thread_ts,
+                len(message_text) if message_text else 0,
+                len(conversation) if conversation else 0,
+                type(e).__name__,
+                bool(os.environ.get("ANTHROPIC_API_KEY")),
+                exc_info=True,
+            )
             
             # Fallback to simple response in chat mode (default behavior)
             return {
@@ -91,22 +106,22 @@ class ChatService:
                     "text": "Sorry, I encountered an error processing your message. Please try again.",
                     "type": "error"
                 }],
-                "metadata": {"error": str(e), "error_details": error_details}
+                "metadata": {"error": type(e).__name__}
             }
     
     @staticmethod
-    def _handle_chat_mode(user_id: str, channel_id: str, thread_ts: str, 
-                         message_text: str, conversation: List[Dict]) -> Dict | None:
-        """Handle message in chat mode using active persona."""
+    def _handle_chat_mode(user_id: str, channel_id: str, thread_ts: str,
+                         message_text: str, conversation: List[Dict],
+                         on_text: Optional[Callable[[str], None]] = None) -> Dict | None:
+        """Handle message in chat mode using active persona.
+
+        on_text, when given, receives each streamed text delta so callers
+        can surface partial output (e.g. editing a Slack message in place).
+        """
         try:
-            # Get active persona
-            active_persona = PersonaManager.get_active_persona(user_id)
-            
-            if not active_persona:
-                # Create default personas if none exist
-                PersonaManager._ensure_default_personas(user_id)
-                active_persona = PersonaManager.get_active_persona(user_id)
-            
+            # Get active persona (cached; creates defaults for new users)
+            active_persona = PersonaManager.get_or_create_active_persona(user_id)
+
             if not active_persona:
                 raise Exception("Unable to create or find active persona")
             
@@ -116,9 +131,10 @@ class ChatService:
             # Generate response using persona settings
             response_text = get_standard_claude_response(
                 conversation,
-                system_prompt=active_persona['system_prompt'], 
+                system_prompt=active_persona['system_prompt'],
                 temperature=active_persona['temperature'],
-                model_name=active_persona['model']
+                model_name=active_persona['model'],
+                on_text=on_text
             )
             
             if not response_text:
@@ -144,8 +160,13 @@ class ChatService:
     
     @staticmethod
     def _handle_ab_testing_mode(user_id: str, channel_id: str, thread_ts: str,
-                               message_text: str, conversation: List[Dict]) -> Dict | None:
-        """Handle message in A/B testing mode."""
+                               message_text: str, conversation: List[Dict],
+                               on_ab_response: Optional[Callable[[str, str], None]] = None) -> Dict | None:
+        """Handle message in A/B testing mode.
+
+        on_ab_response, when given, is called with (variant, text) as each
+        variant finishes so callers can show the faster one immediately.
+        """
         try:
             # Use existing A/B testing service
             ab_test, response_a, response_b = ABTestingService.create_ab_test_responses(
@@ -153,22 +174,27 @@ class ChatService:
                 channel_id=channel_id,
                 thread_ts=thread_ts,
                 original_prompt=message_text,
-                conversation=conversation
+                conversation=conversation,
+                on_response_ready=on_ab_response
             )
             
-            # Create Slack message format for both responses
+            # Create Slack message format for both responses; one preference
+            # read covers both variants' persona names
+            user_prefs = UserPreferencesService.get_user_preferences(user_id)
             message_a = ABTestingService.create_slack_message_with_buttons(
                 response_text=response_a.response_text,
                 variant="A",
                 test_id=ab_test.id,
-                user_id=user_id
+                user_id=user_id,
+                persona_name=user_prefs['response_a']['persona_name']
             )
-            
+
             message_b = ABTestingService.create_slack_message_with_buttons(
                 response_text=response_b.response_text,
                 variant="B",
                 test_id=ab_test.id,
-                user_id=user_id
+                user_id=user_id,
+                persona_name=user_prefs['response_b']['persona_name']
             )
             
             if not response_a or not response_b:
@@ -1,3 +1,4 @@
+import re
 from typing import Dict, Optional, Tuple
 from models import db
 from services.persona_manager import PersonaManager
@@ -6,6 +7,22 @@ from utils import setup_logger
 
 logger = setup_logger(__name__)
 
+# Keyword-to-prompt suggestion table, hoisted so it isn't rebuilt per call.
+# Earlier keys win when several keywords appear in the same name/description.
+_PROMPT_SUGGESTIONS = {
+    'code': 'You are an expert software engineer. Provide clear, efficient code solutions with explanations. Always include error handling and best practices.',
+    'creative': 'You are a creative and expressive AI assistant. Think outside the box, use vivid language, and bring imagination to your responses.',
+    'analyst': 'You are an analytical AI assistant focused on logic, precision, and data-driven insights. Provide structured, methodical responses.',
+    'writer': 'You are a professional writing coach. Help improve clarity, style, and structure. Provide specific suggestions with examples.',
+    'technical': 'You are a technical expert who explains complex concepts clearly. Break down problems systematically and provide detailed explanations.',
+    'assistant': 'You are a helpful AI assistant. Provide clear, accurate, and balanced responses. Be concise but thorough.',
+}
+
+# Single alternation so one C-level scan finds every keyword at once
+_SUGGESTION_RE = re.compile('|'.join(map(re.escape, _PROMPT_SUGGESTIONS)))
+
+_DEFAULT_SUGGESTION = "You are a helpful AI assistant specialized in [your domain]. Provide clear, accurate responses with expertise in [your area]."
+
 
 class PersonaCreationService:
     """Service for creating personas with inline prompt management."""
@@ -30,16 +47,20 @@ class PersonaCreationService:
         """
         try:
             system_prompt_id = None
-            
+
+            # Strip once up front; persona prompts can be large and every
+            # comparison below works on the normalized form
+            prompt_content = prompt_content.strip()
+
             # Case 1: Using existing prompt without modification
             if existing_prompt_id and not save_new_prompt:
                 # Verify the existing prompt is accessible
                 existing_prompt = SystemPromptManager.get_prompt_by_id(existing_prompt_id, user_id)
                 if not existing_prompt:
                     return False, "Selected prompt not found or not accessible", None
-                
+
                 # Check if content matches existing prompt (no modification)
-                if prompt_content.strip() == existing_prompt['content'].strip():
+                if prompt_content == existing_prompt['content'].strip():
                     system_prompt_id = existing_prompt_id
                     logger.info(f"Using existing prompt {existing_prompt_id} for persona '{persona_name}'")
                 else:
@@ -97,36 +118,32 @@ class PersonaCreationService:
     @staticmethod
     def get_prompt_suggestions_for_persona(persona_name: str, description: str) -> str:
         """Generate prompt suggestions based on persona name and description."""
-        suggestions = {
-            'code': 'You are an expert software engineer. Provide clear, efficient code solutions with explanations. Always include error handling and best practices.',
-            'creative': 'You are a creative and expressive AI assistant. Think outside the box, use vivid language, and bring imagination to your responses.',
-            'analyst': 'You are an analytical AI assistant focused on logic, precision, and data-driven insights. Provide structured, methodical responses.',
-            'writer': 'You are a professional writing coach. Help improve clarity, style, and structure. Provide specific suggestions with examples.',
-            'technical': 'You are a technical expert who explains complex concepts clearly. Break down problems systematically and provide detailed explanations.',
-            'assistant': 'You are a helpful AI assistant. Provide clear, accurate, and balanced responses. Be concise but thorough.',
-        }
-        
-        # Simple keyword matching for suggestions
-        name_lower = persona_name.lower()
-        desc_lower = description.lower() if description else ""
-        combined = f"{name_lower} {desc_lower}"
-        
-        for keyword, prompt in suggestions.items():
-            if keyword in combined:
-                return prompt
-        
-        # Default suggestion
-        return "You are a helpful AI assistant specialized in [your domain]. Provide clear, accurate responses with expertise in [your area]."
+        combined = f"{persona_name} {description or ''}".lower()
+
+        # One regex pass collects every keyword present, then table order
+        # decides priority (matching the old first-key-wins loop)
+        found = set(_SUGGESTION_RE.findall(combined))
+        if found:
+            for keyword, prompt in _PROMPT_SUGGESTIONS.items():
+                if keyword in found:
+                    return prompt
+
+        return _DEFAULT_SUGGESTION
     
     @staticmethod
     def detect_prompt_changes(
-        original_prompt_id: Optional[int],
+        original_content: Optional[str],
         current_content: str,
-        user_id: str
+        is_default: bool = False
     ) -> Dict[str, bool]:
         """
         Detect if prompt content has changed and suggest actions.
-        
+
+        Takes the original content directly so callers that already hold
+        the prompt (e.g. a modal that loaded it to render the form) don't
+        pay a lookup just to compare strings; detect_prompt_changes_by_id
+        covers callers that only have the id.
+
         Returns:
             {
                 'has_changes': bool,
@@ -134,34 +151,42 @@ class PersonaCreationService:
                 'is_custom': bool
             }
         """
-        if not original_prompt_id:
+        if original_content is None:
             return {
                 'has_changes': True,
                 'suggest_save': True,
                 'is_custom': True
             }
-        
+
+        has_changes = original_content.strip() != current_content.strip()
+
+        return {
+            'has_changes': has_changes,
+            'suggest_save': has_changes,  # Suggest saving if there are changes
+            'is_custom': not is_default
+        }
+
+    @staticmethod
+    def detect_prompt_changes_by_id(
+        original_prompt_id: Optional[int],
+        current_content: str,
+        user_id: str
+    ) -> Dict[str, bool]:
+        """Detect prompt changes when only the original prompt id is known."""
+        if not original_prompt_id:
+            return PersonaCreationService.detect_prompt_changes(None, current_content)
+
         try:
             original_prompt = SystemPromptManager.get_prompt_by_id(original_prompt_id, user_id)
             if not original_prompt:
-                return {
-                    'has_changes': True,
-                    'suggest_save': True,
-                    'is_custom': True
-                }
-            
-            original_content = original_prompt['content'].strip()
-            current_content = current_content.strip()
-            
-            has_changes = original_content != current_content
-            is_default = original_prompt['is_default']
-            
-            return {
-                'has_changes': has_changes,
-                'suggest_save': has_changes,  # Suggest saving if there are changes
-                'is_custom': not is_default
-            }
-            
+                return PersonaCreationService.detect_prompt_changes(None, current_content)
+
+            return PersonaCreationService.detect_prompt_changes(
+                original_prompt['content'],
+                current_content,
+                is_default=original_prompt['is_default']
+            )
+
         except Exception as e:
             logger.error(f"Error detecting prompt changes: {e}")
             return {
@@ -1,8 +1,12 @@
 import os
+import threading
+import time
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
+from sqlalchemy.orm import selectinload
 from models import db, AIPersona, UserPreferences, SystemPrompt
 from services.system_prompt_manager import SystemPromptManager
-from utils import setup_logger
+from utils import request_cached, setup_logger
 
 logger = setup_logger(__name__)
 
@@ -10,18 +14,35 @@ logger = setup_logger(__name__)
 class PersonaManager:
     """Service for managing AI personas with system prompt references."""
     
-    # Cache to prevent repeated database setup operations
+    # Cache to prevent repeated database setup operations. Entries are just
+    # user-id strings, so growth is bounded by workspace size; the lock
+    # keeps concurrent first messages from the same new user from racing
+    # into duplicate default-persona inserts
     _setup_cache = {
         'system_prompts_ensured': False,
         'user_personas_ensured': set()
     }
-    
+    _setup_lock = threading.Lock()
+
+    # Pre-formatted Slack selector options per user: user_id -> (built_at, options).
+    # Invalidated on persona writes; the short TTL is a backstop for writes
+    # that happen in another process (e.g. the admin dashboard)
+    _persona_options_cache = {}
+    _PERSONA_OPTIONS_TTL = 60  # seconds
+
+    # Active persona per user: user_id -> (built_at, persona dict). Read on
+    # every chat-mode message but changed only when the user switches or
+    # edits personas, so writes invalidate and the TTL backstops
+    # out-of-process changes
+    _active_persona_cache = {}
+    _ACTIVE_PERSONA_TTL = 300  # seconds
+
     # Default personas using system prompt titles
     DEFAULT_PERSONAS = [
         {
             'name': 'Assistant',
             'description': 'Helpful, accurate, and balanced responses for general assistance',
-            'model': 'sonnet',
+            'model': 'haiku',
             'temperature': 0.3,
             'system_prompt_title': 'Assistant'
         },
@@ -42,27 +63,97 @@ class PersonaManager:
     ]
     
     @staticmethod
+    @request_cached
     def get_user_personas(user_id: str) -> List[Dict]:
         """Get all personas for a user, creating defaults if none exist."""
         # Ensure default prompts and personas exist (with caching)
         PersonaManager._ensure_default_personas(user_id)
         
-        personas = AIPersona.query.filter_by(user_id=user_id).order_by(
+        # selectinload pulls every persona's prompt in one IN (...) query
+        # instead of a lazy SELECT per row inside _persona_to_dict
+        personas = AIPersona.query.options(
+            selectinload(AIPersona.system_prompt)
+        ).filter_by(user_id=user_id).order_by(
             AIPersona.is_favorite.desc(),
             AIPersona.usage_count.desc(),
             AIPersona.name
         ).all()
-        
-        return [PersonaManager._persona_to_dict(persona) for persona in personas]
-    
+
+        # map() with the bound function avoids re-resolving the attribute
+        # per row in this O(N) conversion
+        return list(map(PersonaManager._persona_to_dict, personas))
+
+    @staticmethod
+    def list_all_with_prompts(limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
+        """Get personas (all users) with system prompts eager-loaded.
+
+        _persona_to_dict dereferences the lazy system_prompt backref, so a
+        plain query pays one extra SELECT per persona. selectinload resolves
+        every prompt in a single IN (...) query instead. limit/offset allow
+        callers to page through large tables instead of materializing them.
+        """
+        query = AIPersona.query.options(
+            selectinload(AIPersona.system_prompt)
+        ).order_by(
+            AIPersona.is_favorite.desc(),
+            AIPersona.usage_count.desc()
+        )
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+
+        return list(map(PersonaManager._persona_to_dict, query.all()))
+
+    @staticmethod
+    def get_persona_options(user_id: str) -> List[Dict]:
+        """Get Slack select options for a user's personas, cached briefly."""
+        now = time.time()
+        entry = PersonaManager._persona_options_cache.get(user_id)
+        if entry and now - entry[0] < PersonaManager._PERSONA_OPTIONS_TTL:
+            return entry[1]
+
+        options = [
+            {
+                "text": {"type": "plain_text", "text": persona['name']},
+                "value": str(persona['id'])
+            }
+            for persona in PersonaManager.get_user_personas(user_id)
+        ]
+
+        PersonaManager._persona_options_cache[user_id] = (now, options)
+        return options
+
+    @staticmethod
+    def _invalidate_persona_options(user_id: str) -> None:
+        """Drop the cached selector options after a persona write."""
+        PersonaManager._persona_options_cache.pop(user_id, None)
+
     @staticmethod
     def get_persona_by_id(persona_id: int, user_id: str) -> Optional[Dict]:
         """Get a specific persona by ID."""
-        persona = AIPersona.query.filter_by(id=persona_id, user_id=user_id).first()
+        persona = AIPersona.query.options(
+            selectinload(AIPersona.system_prompt)
+        ).filter_by(id=persona_id, user_id=user_id).first()
         if persona:
             return PersonaManager._persona_to_dict(persona)
         return None
     
+    @staticmethod
+    def get_personas_by_ids(persona_ids: List[int], user_id: str) -> List[Dict]:
+        """Get multiple personas by ID in a single query."""
+        if not persona_ids:
+            return []
+
+        personas = AIPersona.query.options(
+            selectinload(AIPersona.system_prompt)
+        ).filter(
+            AIPersona.id.in_(persona_ids),
+            AIPersona.user_id == user_id
+        ).all()
+
+        return [PersonaManager._persona_to_dict(persona) for persona in personas]
+
     @staticmethod
     def create_persona(user_id: str, name: str, model: str, temperature: float,
                       system_prompt_id: int, description: str = None) -> Optional[Dict]:
@@ -93,7 +184,9 @@ class PersonaManager:
             
             db.session.add(persona)
             db.session.commit()
-            
+            PersonaManager._invalidate_persona_options(user_id)
+            PersonaManager._invalidate_active_persona(user_id)
+
             logger.info(f"Created persona '{name}' for user {user_id}")
             return PersonaManager._persona_to_dict(persona)
             
@@ -140,6 +233,8 @@ class PersonaManager:
                 persona.description = description
             
             db.session.commit()
+            PersonaManager._invalidate_persona_options(user_id)
+            PersonaManager._invalidate_active_persona(user_id)
             logger.info(f"Updated persona {persona_id} for user {user_id}")
             return True
             
@@ -165,7 +260,9 @@ class PersonaManager:
             
             db.session.delete(persona)
             db.session.commit()
-            
+            PersonaManager._invalidate_persona_options(user_id)
+            PersonaManager._invalidate_active_persona(user_id)
+
             logger.info(f"Deleted persona {persona_id} for user {user_id}")
             return True
             
@@ -222,6 +319,32 @@ class PersonaManager:
         personas = PersonaManager.get_user_personas(user_id)
         return personas[0] if personas else None
     
+    @staticmethod
+    def get_or_create_active_persona(user_id: str) -> Optional[Dict]:
+        """Get the active persona, creating the defaults for new users.
+
+        Collapses the lookup / ensure-defaults / re-lookup dance callers
+        used to do into one call, fronted by a short per-user cache so the
+        chat-mode hot path usually skips the database entirely.
+        """
+        entry = PersonaManager._active_persona_cache.get(user_id)
+        if entry is not None and time.monotonic() - entry[0] < PersonaManager._ACTIVE_PERSONA_TTL:
+            return entry[1]
+
+        active_persona = PersonaManager.get_active_persona(user_id)
+        if not active_persona:
+            PersonaManager._ensure_default_personas(user_id)
+            active_persona = PersonaManager.get_active_persona(user_id)
+
+        if active_persona:
+            PersonaManager._active_persona_cache[user_id] = (time.monotonic(), active_persona)
+        return active_persona
+
+    @staticmethod
+    def _invalidate_active_persona(user_id: str) -> None:
+        """Drop a user's cached active persona after a persona write."""
+        PersonaManager._active_persona_cache.pop(user_id, None)
+
     @staticmethod
     def set_active_persona(user_id: str, persona_id: int) -> bool:
         """Set the active persona for chat mode."""
@@ -241,7 +364,8 @@ class PersonaManager:
             
             user_prefs.active_persona_id = persona_id
             db.session.commit()
-            
+            PersonaManager._invalidate_active_persona(user_id)
+
             logger.info(f"Set active persona to {persona_id} for user {user_id}")
             return True
             
@@ -253,55 +377,75 @@ class PersonaManager:
     @staticmethod
     def _ensure_default_personas(user_id: str) -> None:
         """Ensure default personas exist for a user - with caching to prevent repeated calls."""
-        # Check if we've already ensured personas for this user
+        # Unlocked fast path for the common case (already ensured), then a
+        # double-checked lock so two concurrent first messages from the same
+        # new user serialize instead of both inserting the defaults
         if user_id in PersonaManager._setup_cache['user_personas_ensured']:
             return
-        
-        try:
-            # First ensure default prompts exist (but only once)
-            if not PersonaManager._setup_cache['system_prompts_ensured']:
-                SystemPromptManager._ensure_default_prompts()
-                PersonaManager._setup_cache['system_prompts_ensured'] = True
-            
-            existing_count = AIPersona.query.filter_by(user_id=user_id).count()
-            if existing_count > 0:
-                # Cache that this user has been set up
-                PersonaManager._setup_cache['user_personas_ensured'].add(user_id)
-                return  # User already has personas
-            
-            # Create default personas
-            for persona_data in PersonaManager.DEFAULT_PERSONAS:
-                # Find the system prompt by title
-                prompt = SystemPrompt.query.filter_by(
-                    title=persona_data['system_prompt_title'],
-                    is_default=True
-                ).first()
-                
-                if not prompt:
-                    logger.error(f"Default prompt '{persona_data['system_prompt_title']}' not found")
-                    continue
-                
-                persona = AIPersona(
-                    user_id=user_id,
-                    name=persona_data['name'],
-                    description=persona_data['description'],
-                    model=persona_data['model'],
-                    temperature=persona_data['temperature'],
-                    system_prompt_id=prompt.id,
-                    is_favorite=(persona_data['name'] == 'Assistant'),  # Make Assistant default favorite
-                    usage_count=0
-                )
-                db.session.add(persona)
+
+        with PersonaManager._setup_lock:
+            if user_id in PersonaManager._setup_cache['user_personas_ensured']:
+                return
+
+            try:
+                # First ensure default prompts exist (but only once)
+                if not PersonaManager._setup_cache['system_prompts_ensured']:
+                    SystemPromptManager._ensure_default_prompts()
+                    PersonaManager._setup_cache['system_prompts_ensured'] = True
             
-            db.session.commit()
-            logger.info(f"Created default personas for user {user_id}")
+                # Existence probe instead of COUNT(*): LIMIT 1 on the id stops
+                # at the first matching row rather than scanning them all
+                has_personas = db.session.query(AIPersona.id).filter_by(user_id=user_id).first()
+                if has_personas:
+                    # Cache that this user has been set up
+                    PersonaManager._setup_cache['user_personas_ensured'].add(user_id)
+                    return  # User already has personas
             
-            # Cache successful setup
-            PersonaManager._setup_cache['user_personas_ensured'].add(user_id)
+                # Resolve every default prompt in one query instead of one
+                # lookup per persona
+                titles = [p['system_prompt_title'] for p in PersonaManager.DEFAULT_PERSONAS]
+                prompt_ids_by_title = {
+                    prompt.title: prompt.id
+                    for prompt in SystemPrompt.query.filter(
+                        SystemPrompt.title.in_(titles),
+                        SystemPrompt.is_default == True
+                    ).all()
+                }
+
+                # Build plain row dicts and insert the whole set in one
+                # statement - nothing reads the new rows back here, so the
+                # unit-of-work bookkeeping of per-object add() is wasted effort
+                rows = []
+                for persona_data in PersonaManager.DEFAULT_PERSONAS:
+                    prompt_id = prompt_ids_by_title.get(persona_data['system_prompt_title'])
+                    if prompt_id is None:
+                        logger.error(f"Default prompt '{persona_data['system_prompt_title']}' not found")
+                        continue
+
+                    rows.append({
+                        'user_id': user_id,
+                        'name': persona_data['name'],
+                        'description': persona_data['description'],
+                        'model': persona_data['model'],
+                        'temperature': persona_data['temperature'],
+                        'system_prompt_id': prompt_id,
+                        'is_favorite': persona_data['name'] == 'Assistant',  # Make Assistant default favorite
+                        'usage_count': 0
+                    })
+
+                if rows:
+                    db.session.bulk_insert_mappings(AIPersona, rows)
+                db.session.commit()
+                PersonaManager._invalidate_persona_options(user_id)
+                PersonaManager._invalidate_active_persona(user_id)
+                logger.info(f"Created default personas for user {user_id}")
+
+                # Cache successful setup
+                PersonaManager._setup_cache['user_personas_ensured'].add(user_id)
             
-        except Exception as e:
-            logger.error(f"Error ensuring default personas for user {user_id}: {e}")
-            db.session.rollback()
+            except Exception as e:
+                logger.error(f"Error ensuring default personas for user {user_id}: {e}")
+                db.session.rollback()
     
     @staticmethod
     def _persona_to_dict(persona: AIPersona) -> Dict:
@@ -323,8 +467,9 @@ class PersonaManager:
         }
     
     @staticmethod
+    @lru_cache(maxsize=32)
     def _load_prompt_file(filename: str) -> str:
-        """Load prompt from file."""
+        """Load prompt from file, reading each file from disk only once."""
         try:
             current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             prompt_path = os.path.join(current_dir, "prompts", filename)
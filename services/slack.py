@@ -1,5 +1,9 @@
 import re
 import base64
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 import requests
 
@@ -7,10 +11,74 @@ from utils import setup_logger
 
 logger = setup_logger(__name__)
 
+# PDF fetches are pure network waits (files_info + the download), so a
+# thread with several attachments pulls them concurrently instead of one
+# after another. The shared Session reuses connections to Slack's file
+# host across downloads.
+_pdf_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pdf-fetch")
+_http_session = requests.Session()
+
+# Claude's PDF limit; also the cap we hold downloads to
+_MAX_PDF_SIZE_BYTES = 32 * 1024 * 1024
+
+# Streaming read size: a multiple of 3 so each full chunk base64-encodes
+# without padding and the encoded pieces concatenate cleanly
+_PDF_CHUNK_BYTES = 3 * 65536
+
+# Every message in a thread triggers a full history rebuild, so the same
+# attachment gets re-downloaded on each follow-up; Slack file ids are
+# stable and the content immutable, so cache the encoded payload. Bounded
+# LRU with a TTL - entries can run tens of MB, hence the small cap.
+_PDF_CACHE_MAX_ENTRIES = 64
+# An entry-count cap alone isn't enough: each payload can run ~43MB
+# (32MB raw at base64's 4/3), so the real bound is cumulative bytes -
+# LRU entries are evicted until the total fits the budget
+_PDF_CACHE_MAX_TOTAL_BYTES = 128 * 1024 * 1024
+_PDF_CACHE_TTL_SECONDS = 3600
+_pdf_cache: OrderedDict = OrderedDict()
+_pdf_cache_total_bytes = 0
+_pdf_cache_lock = threading.Lock()
+
+
+def _pdf_cache_get(file_id: str) -> Optional[str]:
+    global _pdf_cache_total_bytes
+    with _pdf_cache_lock:
+        entry = _pdf_cache.get(file_id)
+        if entry is None:
+            return None
+        cached_at, data = entry
+        if time.monotonic() - cached_at > _PDF_CACHE_TTL_SECONDS:
+            del _pdf_cache[file_id]
+            _pdf_cache_total_bytes -= len(data)
+            return None
+        _pdf_cache.move_to_end(file_id)
+        return data
+
+
+def _pdf_cache_put(file_id: str, data: str) -> None:
+    global _pdf_cache_total_bytes
+    if len(data) > _PDF_CACHE_MAX_TOTAL_BYTES:
+        return  # would evict everything else and still bust the budget
+    with _pdf_cache_lock:
+        previous = _pdf_cache.get(file_id)
+        if previous is not None:
+            _pdf_cache_total_bytes -= len(previous[1])
+        _pdf_cache[file_id] = (time.monotonic(), data)
+        _pdf_cache.move_to_end(file_id)
+        _pdf_cache_total_bytes += len(data)
+        while (len(_pdf_cache) > _PDF_CACHE_MAX_ENTRIES
+               or _pdf_cache_total_bytes > _PDF_CACHE_MAX_TOTAL_BYTES):
+            _, (_, evicted) = _pdf_cache.popitem(last=False)
+            _pdf_cache_total_bytes -= len(evicted)
+
+# Compiled once at import; clean_user_mentions runs for every message in
+# every thread rebuild, so skip the per-call pattern-cache lookup
+_MENTION_RE = re.compile(r"<@[A-Z0-9]+>")
+
 
 def clean_user_mentions(text: str) -> str:
     """Remove user mentions from text."""
-    return re.sub(r"<@[A-Z0-9]+>", "", text).strip()
+    return _MENTION_RE.sub("", text).strip()
 
 
 def get_thread_history(client, channel: str, thread_ts: str) -> List[Dict]:
@@ -19,8 +87,12 @@ def get_thread_history(client, channel: str, thread_ts: str) -> List[Dict]:
     cursor = None
     while True:
         try:
+            # Cursor pagination is inherently serial - the next cursor only
+            # arrives with the current page - so the win here is fewer
+            # round trips: 200 per page (Slack's recommended ceiling)
+            # instead of 100 halves the requests for long threads
             result = client.conversations_replies(
-                channel=channel, ts=thread_ts, cursor=cursor, limit=100
+                channel=channel, ts=thread_ts, cursor=cursor, limit=200
             )
             messages.extend(result["messages"])
             if not result.get("has_more", False):
@@ -39,6 +111,15 @@ def get_conversation_history(
     conversation = []
     messages = get_thread_history(client, channel, thread_ts)
 
+    # Kick off every PDF download up front so they overlap; the build loop
+    # below collects results in (message, file) order, so document blocks
+    # land exactly where the serial version put them
+    pdf_futures = {
+        (i, j): _pdf_executor.submit(_fetch_pdf, client, file)
+        for i, msg in enumerate(messages)
+        for j, file in enumerate(msg.get('files', []))
+        if _is_valid_pdf(file)
+    }
 
     for i, msg in enumerate(messages):
         role = "assistant" if msg.get("user") == bot_user_id else "user"
@@ -46,32 +127,19 @@ def get_conversation_history(
         msg_ts = msg.get("ts", "unknown")
         msg_user = msg.get("user", "unknown")
         
-        logger.info(f"RAW_MSG[{i}]: user={msg_user}, role={role}, ts={msg_ts}, text='{msg_text[:50]}{'...' if len(msg_text) > 50 else ''}'")
+        # Debug-level: this fires once per message per rebuild, and %-style
+        # args mean the preview slice isn't even built unless DEBUG is on
+        logger.debug("RAW_MSG[%d]: user=%s role=%s ts=%s text=%.50s", i, msg_user, role, msg_ts, msg_text)
         
         content = []
 
         # Handle any files in the message
-        files = msg.get('files', [])
-        for file in files:
-            if _is_valid_pdf(file):
-                try:
-                    response = client.files_info(file=file['id'])
-                    url = response['file']['url_private']
-                    headers = {'Authorization': f'Bearer {client.token}'}
-                    response = requests.get(url, headers=headers)
-                    file_content = base64.b64encode(response.content).decode('utf-8')
-                    
-                    content.append({
-                        "type": "document",
-                        "source": {
-                            "type": "base64",
-                            "media_type": "application/pdf",
-                            "data": file_content
-                        },
-                        "citations": {"enabled": True}
-                    })
-                except Exception as e:
-                    logger.error(f"Error processing file {file.get('name')}: {str(e)}")
+        for j, _ in enumerate(msg.get('files', [])):
+            future = pdf_futures.get((i, j))
+            if future is not None:
+                document = future.result()
+                if document is not None:
+                    content.append(document)
 
         # Add text content if present
         if msg_text:
@@ -81,6 +149,70 @@ def get_conversation_history(
 
     return conversation
 
+def _fetch_pdf(client, file: Dict) -> Optional[Dict]:
+    """Download one PDF attachment and wrap it as a document content block.
+
+    Returns None on any failure so a broken attachment drops out of the
+    conversation instead of failing the whole rebuild.
+    """
+    try:
+        file_content = _pdf_cache_get(file['id'])
+        if file_content is not None:
+            return {
+                "type": "document",
+                "source": {
+                    "type": "base64",
+                    "media_type": "application/pdf",
+                    "data": file_content
+                },
+                "citations": {"enabled": True}
+            }
+
+        response = client.files_info(file=file['id'])
+        url = response['file']['url_private']
+        headers = {'Authorization': f'Bearer {client.token}'}
+
+        # Stream the body and encode as it arrives: peak memory is one
+        # chunk plus the encoded output, instead of raw bytes + encoded
+        # copy held simultaneously (~2.3x the file size for a 32MB PDF)
+        with _http_session.get(url, headers=headers, stream=True) as download:
+            content_length = download.headers.get('Content-Length')
+            if content_length and int(content_length) > _MAX_PDF_SIZE_BYTES:
+                logger.error(
+                    f"File {file.get('name')} reports {content_length} bytes, "
+                    f"over the {_MAX_PDF_SIZE_BYTES}-byte limit; skipping download"
+                )
+                return None
+
+            # Only multiples of 3 bytes are encoded per step - the carry
+            # holds the remainder so no padding appears mid-stream
+            encoded_parts = []
+            pending = b""
+            for chunk in download.iter_content(chunk_size=_PDF_CHUNK_BYTES):
+                pending += chunk
+                usable = len(pending) - (len(pending) % 3)
+                if usable:
+                    encoded_parts.append(base64.b64encode(pending[:usable]).decode('ascii'))
+                    pending = pending[usable:]
+            if pending:
+                encoded_parts.append(base64.b64encode(pending).decode('ascii'))
+        file_content = "".join(encoded_parts)
+        _pdf_cache_put(file['id'], file_content)
+
+        return {
+            "type": "document",
+            "source": {
+                "type": "base64",
+                "media_type": "application/pdf",
+                "data": file_content
+            },
+            "citations": {"enabled": True}
+        }
+    except Exception as e:
+        logger.error(f"Error processing file {file.get('name')}: {str(e)}")
+        return None
+
+
 # TODO: add Max page count and make sure it applies to all files
 def _is_valid_pdf(file: Dict) -> bool:
     """
@@ -88,10 +220,7 @@ def _is_valid_pdf(file: Dict) -> bool:
     - Must be PDF
     - Must be under 32MB
     """
-    MAX_SIZE_MB = 32
-    MAX_SIZE_BYTES = MAX_SIZE_MB * 1024 * 1024
-    
     is_pdf = file.get('mimetype') == 'application/pdf'
-    size_ok = file.get('size', float('inf')) <= MAX_SIZE_BYTES
+    size_ok = file.get('size', float('inf')) <= _MAX_PDF_SIZE_BYTES
     
     return is_pdf and size_ok
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict, List, Optional
 from models import db, SystemPrompt
 from utils import setup_logger
@@ -254,8 +255,13 @@ class SystemPromptManager:
         ]
     
     @staticmethod
+    @lru_cache(maxsize=32)
     def load_prompt_from_file(file_path: str) -> str:
-        """Load prompt content from a file in the prompts directory."""
+        """Load prompt content from a file in the prompts directory.
+
+        The files are static, so each one is read from disk only once per
+        process; repeat calls are dictionary lookups.
+        """
         try:
             current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             full_path = os.path.join(current_dir, "prompts", file_path)
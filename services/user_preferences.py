@@ -2,7 +2,7 @@ import os
 from typing import Dict, Optional
 from models import db, UserPreferences, AIPersona
 from services.persona_manager import PersonaManager
-from utils import setup_logger
+from utils import request_cached, setup_logger
 
 logger = setup_logger(__name__)
 
@@ -11,6 +11,7 @@ class UserPreferencesService:
     """Service for managing user preferences for A/B testing and personas."""
     
     @staticmethod
+    @request_cached
     def get_user_preferences(user_id: str) -> Dict:
         """
         Get user preferences with persona-based A/B testing configuration.
@@ -32,15 +33,19 @@ class UserPreferencesService:
                 'persona_id': persona_a['id'],
                 'persona_name': persona_a['name'],
                 'model': persona_a['model'],
-                'temperature': persona_a['temperature'], 
-                'system_prompt': persona_a['system_prompt']
+                'temperature': persona_a['temperature'],
+                'system_prompt': persona_a['system_prompt'],
+                # Pre-truncated copy for storage alongside A/B responses, so
+                # consumers don't re-slice the full prompt per request
+                'system_prompt_preview': persona_a['system_prompt'][:1000]
             },
             'response_b': {
                 'persona_id': persona_b['id'],
                 'persona_name': persona_b['name'],
                 'model': persona_b['model'],
                 'temperature': persona_b['temperature'],
-                'system_prompt': persona_b['system_prompt']
+                'system_prompt': persona_b['system_prompt'],
+                'system_prompt_preview': persona_b['system_prompt'][:1000]
             },
             'chat_mode_enabled': user_prefs.chat_mode_enabled,
             'active_persona_id': user_prefs.active_persona_id
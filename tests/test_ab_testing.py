@@ -12,7 +12,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from server import app
 from models import db, ABTest, ABResponse, ABVote
-from services import ABTestingService
+from services import ABTestingService, UserPreferencesService
 
 load_dotenv()
 
@@ -44,18 +44,21 @@ def test_ab_testing():
             
             # Test message creation
             print("\nTesting Slack message creation...")
+            user_prefs = UserPreferencesService.get_user_preferences("U123TEST")
             message_a = ABTestingService.create_slack_message_with_buttons(
                 response_text=response_a.response_text,
                 variant="A",
                 test_id=ab_test.id,
-                user_id="U123TEST"
+                user_id="U123TEST",
+                persona_name=user_prefs['response_a']['persona_name']
             )
-            
+
             message_b = ABTestingService.create_slack_message_with_buttons(
                 response_text=response_b.response_text,
                 variant="B",
                 test_id=ab_test.id,
-                user_id="U123TEST"
+                user_id="U123TEST",
+                persona_name=user_prefs['response_b']['persona_name']
             )
             
             print("✅ Slack messages with buttons created successfully")
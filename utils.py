@@ -1,7 +1,37 @@
+import functools
 import logging
 from typing import Any
 
 
+def request_cached(fn):
+    """Memoize a function's result for the lifetime of the current Flask request.
+
+    Results are stored on flask.g, so the cache starts empty on every request
+    and is discarded automatically when the request ends - repeated reads of
+    the same rows inside one handler collapse into a single query with no
+    cross-request staleness. Outside a request context the wrapped function
+    is called directly.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args):
+        from flask import g, has_request_context
+
+        if not has_request_context():
+            return fn(*args)
+
+        cache = getattr(g, '_request_query_cache', None)
+        if cache is None:
+            cache = {}
+            g._request_query_cache = cache
+
+        key = (fn.__module__, fn.__qualname__, args)
+        if key not in cache:
+            cache[key] = fn(*args)
+        return cache[key]
+
+    return wrapper
+
+
 def setup_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
 